@@ -68,7 +68,11 @@ class TradingApp:
         # Initialize scrapers that are enabled by YAML
         self.scrapers = {}
         if self.config.get('sources.yahoo_finance.enabled', True):
-            self.scrapers['yahoo_finance'] = YahooFinanceScraper()
+            self.scrapers['yahoo_finance'] = YahooFinanceScraper(
+                max_workers=self.config.get(
+                    'sources.yahoo_finance.max_workers', YahooFinanceScraper.MAX_CONCURRENT_FETCHES
+                )
+            )
         
         if self.config.get('sources.cnbc.enabled', True):
             self.scrapers['cnbc'] = CNBCScraper()
@@ -9,12 +9,34 @@ import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 
 logger = logging.getLogger(__name__)
 
 
+def compile_class_selector(keywords: List[str], tags: Optional[List[str]] = None) -> soupsieve.SoupSieve:
+    """
+    Compile a CSS selector matching elements whose class contains any of the keywords.
+    
+    Equivalent to ``find_all(tags, class_=re.compile('|'.join(keywords)))``, but the
+    selector is compiled once and matched by soupsieve instead of running a Python
+    regex against the class attribute of every element.
+    
+    Args:
+        keywords: Substrings to look for in the class attribute
+        tags: Tag names to restrict the match to (default: any tag)
+        
+    Returns:
+        Compiled selector; use its select/select_one methods on a soup or element
+    """
+    return soupsieve.compile(', '.join(
+        f'{tag}[class*="{keyword}"]' for tag in (tags or ['']) for keyword in keywords
+    ))
+
+
 class BaseScraper(ABC):
     """
     Base class for all scrapers.
@@ -59,28 +81,91 @@ class BaseScraper(ABC):
         self.session = requests.Session()
         self.session.headers.update(self.headers)
     
-    def get_html(self, url: str) -> BeautifulSoup:
+    def get_html(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """
         Get HTML content from a URL and parse it with BeautifulSoup.
         
+        The C-based lxml parser is used instead of the pure-Python html.parser,
+        since parsing dominates the CPU time spent on each scraped page. The raw
+        response bytes are handed to the parser directly so that large pages are
+        not also held in memory as a decoded string.
+        
         Args:
             url: URL to fetch
+            parse_only: Strainer limiting which elements are built into the tree;
+                elements that do not match (and are not inside a match) are skipped
             
         Returns:
             BeautifulSoup object with the parsed HTML
             
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        return self.parse_html(self._make_request(url), parse_only)
+    
+    def parse_html(self, response: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parse a fetched response with BeautifulSoup, as get_html does.
+        
+        Lets a page that was fetched once be parsed again, e.g. with a different strainer.
+        
+        Args:
+            response: Response object
+            parse_only: Strainer limiting which elements are built into the tree
+            
+        Returns:
+            BeautifulSoup object with the parsed HTML
+        """
+        return BeautifulSoup(
+            response.content, 'lxml',
+            from_encoding=self._declared_encoding(response),
+            parse_only=parse_only
+        )
+    
+    def get_html_tree(self, url: str) -> lxml.html.HtmlElement:
+        """
+        Get HTML content from a URL and parse it into an lxml element tree.
+        
+        Cheaper than get_html for large, regular pages such as data tables: no
+        Python object is built per node, and XPath queries are evaluated in C.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Root element of the parsed document
+            
         Raises:
             requests.RequestException: If the request fails after retries
         """
         response = self._make_request(url)
-        return BeautifulSoup(response.text, 'html.parser')
+        parser = lxml.html.HTMLParser(encoding=self._declared_encoding(response))
+        return lxml.html.document_fromstring(response.content, parser=parser)
+    
+    @staticmethod
+    def _declared_encoding(response: requests.Response) -> Optional[str]:
+        """
+        Get the charset declared in a response's Content-Type header.
+        
+        Only a charset the server actually declared is trusted; otherwise the parser
+        detects it from the document itself (e.g. <meta charset>).
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Declared encoding, or None if the header did not declare one
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        return response.encoding if 'charset=' in content_type else None
     
-    def _make_request(self, url: str) -> requests.Response:
+    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Make an HTTP request with retry logic.
         
         Args:
             url: URL to fetch
+            params: Query parameters, URL-encoded and merged into the URL by requests
             
         Returns:
             Response object
@@ -90,7 +175,7 @@ class BaseScraper(ABC):
         """
         for attempt in range(self.retry_count + 1):
             try:
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, params=params, timeout=self.timeout)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
@@ -93,7 +93,7 @@ class CoinGeckoScraper(BaseScraper):
             sleep_time = self.min_request_interval - time_since_last_request
             time.sleep(sleep_time)
         
-        response = self._make_request(url + ('?' + '&'.join([f"{k}={v}" for k, v in params.items()]) if params else ''))
+        response = self._make_request(url, params=params)
         self.last_request_time = time.time()
         
         return response
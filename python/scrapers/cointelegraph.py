@@ -6,17 +6,49 @@ This module provides functionality for scraping cryptocurrency data and news fro
 
 import json
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, compile_class_selector
 
 logger = logging.getLogger(__name__)
 
 
+class _NumericCharTable(dict):
+    """str.translate table that keeps digits, '.' and '-' and deletes everything else."""
+
+    def __missing__(self, codepoint: int) -> None:
+        # Non-ASCII characters are rare, so they fall back to this lookup
+        return None
+
+
+# ASCII entries are precomputed so the common case is resolved entirely in C
+_NUM_KEEP = _NumericCharTable(
+    (ord(c), ord(c) if c.isdigit() or c in '.-' else None) for c in map(chr, range(128))
+)
+
+
+# Article field selectors, compiled once at import time
+_HEADLINE_SELECTOR = compile_class_selector(['title', 'headline'], ['h2', 'h3', 'a'])
+_TIMESTAMP_SELECTOR = compile_class_selector(['date', 'time'], ['time', 'span'])
+_SUMMARY_SELECTOR = compile_class_selector(['summary', 'description', 'excerpt'], ['p', 'div'])
+_AUTHOR_SELECTOR = compile_class_selector(['author', 'byline'], ['span', 'div', 'a'])
+_TAGS_SELECTOR = compile_class_selector(['tags', 'categories'], ['div', 'ul'])
+
+_SUFFIX_MULTIPLIERS = {
+    'K': 1_000,
+    'M': 1_000_000,
+    'B': 1_000_000_000,
+    'T': 1_000_000_000_000
+}
+
+
 class CoinTelegraphScraper(BaseScraper):
     """
     Scraper for CoinTelegraph.
@@ -76,10 +108,10 @@ class CoinTelegraphScraper(BaseScraper):
             logger.warning("Could not extract price data from script, falling back to HTML parsing")
             return self._extract_price_data_from_html(soup, cryptocurrencies)
         
-        # Filter for requested cryptocurrencies
+        # Filter for requested cryptocurrencies (upper-cased once, original order kept)
+        wanted = {c.upper(): c for c in cryptocurrencies}
         result = {}
-        for crypto in cryptocurrencies:
-            crypto_upper = crypto.upper()
+        for crypto_upper in wanted:
             if crypto_upper in price_data:
                 result[crypto_upper] = price_data[crypto_upper]
             else:
@@ -100,23 +132,67 @@ class CoinTelegraphScraper(BaseScraper):
         """
         tags = tags or ['bitcoin', 'ethereum', 'ripple', 'litecoin', 'bitcoin-cash']
         
+        tag_max_articles = max_articles // len(tags)
+        
         result = {
             "total": 0,
             "tags": {}
         }
         
+        if len(tags) == 1:
+            # A worker process costs more to start than a single page takes to parse
+            parsed = {tags[0]: self._run_safely(self._scrape_tag_news, tags[0], tag_max_articles)}
+        else:
+            # Fetch all tag pages concurrently (I/O bound), then parse them in worker
+            # processes (CPU bound) so that the parsing is not serialized by the GIL
+            with ThreadPoolExecutor(max_workers=len(tags)) as executor:
+                pages = dict(zip(tags, executor.map(lambda tag: self._run_safely(self._fetch_tag_page, tag), tags)))
+            
+            parsed = {tag: page for tag, page in pages.items() if isinstance(page, Exception)}
+            fetched = {tag: page for tag, page in pages.items() if not isinstance(page, Exception)}
+            
+            if fetched:
+                with ProcessPoolExecutor(max_workers=min(len(fetched), os.cpu_count() or 1)) as pool:
+                    futures = {
+                        tag: pool.submit(_parse_tag_html, content, encoding, tag_max_articles)
+                        for tag, (content, encoding) in fetched.items()
+                    }
+                    for tag, future in futures.items():
+                        parsed[tag] = self._run_safely(future.result)
+        
         for tag in tags:
-            try:
-                logger.info(f"Scraping news for tag: {tag}")
-                tag_news = self._scrape_tag_news(tag, max_articles // len(tags))
+            tag_news = parsed[tag]
+            if isinstance(tag_news, Exception):
+                logger.error(f"Error scraping news for tag {tag}: {tag_news}")
+                result["tags"][tag] = {"error": str(tag_news)}
+            else:
                 result["tags"][tag] = tag_news
                 result["total"] += tag_news["total"]
-            except Exception as e:
-                logger.error(f"Error scraping news for tag {tag}: {e}")
-                result["tags"][tag] = {"error": str(e)}
         
         return result
     
+    @staticmethod
+    def _run_safely(func, *args):
+        """Call func(*args), returning the raised exception instead of propagating it."""
+        try:
+            return func(*args)
+        except Exception as e:
+            return e
+    
+    def _fetch_tag_page(self, tag: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Fetch the raw news page for a specific tag.
+        
+        Args:
+            tag: Tag to fetch the news page for
+            
+        Returns:
+            Tuple of (page content, declared encoding)
+        """
+        logger.info(f"Scraping news for tag: {tag}")
+        response = self._make_request(self.NEWS_URL.format(tag=tag))
+        return response.content, self._declared_encoding(response)
+    
     def _scrape_tag_news(self, tag: str, max_articles: int) -> Dict:
         """
         Scrape news articles for a specific tag.
@@ -128,9 +204,22 @@ class CoinTelegraphScraper(BaseScraper):
         Returns:
             Dictionary with scraped news data for the tag
         """
+        logger.info(f"Scraping news for tag: {tag}")
         url = self.NEWS_URL.format(tag=tag)
-        soup = self.get_html(url)
+        return self._parse_tag_page(self.get_html(url), max_articles)
+    
+    @classmethod
+    def _parse_tag_page(cls, soup: BeautifulSoup, max_articles: int) -> Dict:
+        """
+        Extract news articles from a parsed tag page.
         
+        Args:
+            soup: BeautifulSoup object with the parsed tag page
+            max_articles: Maximum number of articles to extract
+            
+        Returns:
+            Dictionary with scraped news data for the tag
+        """
         articles = []
         article_count = 0
         
@@ -142,7 +231,7 @@ class CoinTelegraphScraper(BaseScraper):
                 break
                 
             try:
-                article_data = self._extract_article_data(article_element)
+                article_data = cls._extract_article_data(article_element)
                 if article_data:
                     articles.append(article_data)
                     article_count += 1
@@ -165,46 +254,64 @@ class CoinTelegraphScraper(BaseScraper):
             Dictionary with cryptocurrency price data
         """
         # Look for script tags that might contain price data
-        script_tags = soup.find_all('script')
-        
-        for script in script_tags:
+        for script in soup.find_all('script'):
             script_content = script.string
-            if not script_content:
+            # Cheap substring check so the regex only runs on state scripts
+            if not script_content or 'window.__INITIAL_STATE__' not in script_content:
                 continue
                 
-            # Look for JSON data in the script
+            # Look for JSON data in the script; a script that cannot be parsed completely
+            # is skipped, so the caller never gets partial data instead of its fallback
             try:
-                # Find JSON-like structures in the script
                 json_match = re.search(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', script_content, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group(1))
-                    
-                    # Navigate through the data structure to find price information
-                    if 'priceIndex' in data and 'data' in data['priceIndex']:
-                        price_data = {}
-                        
-                        for crypto in data['priceIndex']['data']:
-                            symbol = crypto.get('symbol', '').upper()
-                            if not symbol:
-                                continue
-                                
-                            price_data[symbol] = {
-                                "name": crypto.get('name'),
-                                "symbol": symbol,
-                                "price": self._parse_value(crypto.get('price', {}).get('value')),
-                                "market_cap": self._parse_value(crypto.get('marketCap', {}).get('value')),
-                                "volume_24h": self._parse_value(crypto.get('volume24h', {}).get('value')),
-                                "change_24h": self._parse_percent(crypto.get('change24h', {}).get('value')),
-                                "change_7d": self._parse_percent(crypto.get('change7d', {}).get('value')),
-                                "last_updated": crypto.get('lastUpdated')
-                            }
-                        
-                        return price_data
+                if not json_match:
+                    continue
+                # The first state object that parses is the page's state; the remaining
+                # scripts are irrelevant even if it has no price index
+                return self._parse_price_index(json.loads(json_match.group(1)))
             except (json.JSONDecodeError, AttributeError) as e:
-                logger.debug(f"Error parsing JSON from script: {e}")
+                logger.debug(f"Error parsing price data from script: {e}")
         
         return {}
     
+    def _parse_price_index(self, data: Dict) -> Dict:
+        """
+        Build cryptocurrency price data from a parsed INITIAL_STATE object.
+        
+        Args:
+            data: Parsed INITIAL_STATE object
+            
+        Returns:
+            Dictionary with cryptocurrency price data (empty if it has no price index)
+            
+        Raises:
+            AttributeError: If an entry of the price index is malformed
+        """
+        try:
+            cryptos = data['priceIndex']['data']
+        except (KeyError, TypeError):
+            logger.warning("INITIAL_STATE found but has no priceIndex data; the page schema may have changed")
+            return {}
+        
+        price_data = {}
+        for crypto in cryptos:
+            symbol = crypto.get('symbol', '').upper()
+            if not symbol:
+                continue
+                
+            price_data[symbol] = {
+                "name": crypto.get('name'),
+                "symbol": symbol,
+                "price": self._parse_value(crypto.get('price', {}).get('value')),
+                "market_cap": self._parse_value(crypto.get('marketCap', {}).get('value')),
+                "volume_24h": self._parse_value(crypto.get('volume24h', {}).get('value')),
+                "change_24h": self._parse_percent(crypto.get('change24h', {}).get('value')),
+                "change_7d": self._parse_percent(crypto.get('change7d', {}).get('value')),
+                "last_updated": crypto.get('lastUpdated')
+            }
+        
+        return price_data
+    
     def _extract_price_data_from_html(self, soup: BeautifulSoup, cryptocurrencies: List[str]) -> Dict[str, Dict]:
         """
         Extract cryptocurrency price data from HTML elements.
@@ -227,6 +334,7 @@ class CoinTelegraphScraper(BaseScraper):
             
         # Find all rows in the table
         rows = price_table.find_all('tr')
+        wanted = frozenset(c.upper() for c in cryptocurrencies)
         
         for row in rows[1:]:  # Skip header row
             try:
@@ -238,7 +346,7 @@ class CoinTelegraphScraper(BaseScraper):
                 symbol = symbol_element.text.strip().upper()
                 
                 # Check if this cryptocurrency is in the requested list
-                if symbol not in [c.upper() for c in cryptocurrencies]:
+                if symbol not in wanted:
                     continue
                     
                 # Extract name
@@ -270,7 +378,8 @@ class CoinTelegraphScraper(BaseScraper):
         
         return result
     
-    def _extract_article_data(self, article_element) -> Optional[Dict]:
+    @classmethod
+    def _extract_article_data(cls, article_element) -> Optional[Dict]:
         """
         Extract data from an article element.
         
@@ -281,7 +390,7 @@ class CoinTelegraphScraper(BaseScraper):
             Dictionary with article data or None if extraction fails
         """
         # Find headline
-        headline_element = article_element.find(['h2', 'h3', 'a'], class_=re.compile('title|headline'))
+        headline_element = _HEADLINE_SELECTOR.select_one(article_element)
         if not headline_element:
             return None
             
@@ -292,14 +401,14 @@ class CoinTelegraphScraper(BaseScraper):
             
         link = link_element['href']
         if not link.startswith('http'):
-            link = self.BASE_URL + link
+            link = cls.BASE_URL + link
             
         # Find timestamp
-        timestamp_element = article_element.find(['time', 'span'], class_=re.compile('date|time|timestamp'))
+        timestamp_element = _TIMESTAMP_SELECTOR.select_one(article_element)
         timestamp = timestamp_element.text.strip() if timestamp_element else None
         
         # Find summary
-        summary_element = article_element.find(['p', 'div'], class_=re.compile('summary|description|excerpt'))
+        summary_element = _SUMMARY_SELECTOR.select_one(article_element)
         summary = summary_element.text.strip() if summary_element else None
         
         # Find image
@@ -312,12 +421,12 @@ class CoinTelegraphScraper(BaseScraper):
                     break
         
         # Find author
-        author_element = article_element.find(['span', 'div', 'a'], class_=re.compile('author|byline'))
+        author_element = _AUTHOR_SELECTOR.select_one(article_element)
         author = author_element.text.strip() if author_element else None
         
         # Find tags
         tags = []
-        tags_container = article_element.find(['div', 'ul'], class_=re.compile('tags|categories'))
+        tags_container = _TAGS_SELECTOR.select_one(article_element)
         if tags_container:
             tag_elements = tags_container.find_all('a')
             tags = [tag.text.strip() for tag in tag_elements]
@@ -345,35 +454,7 @@ class CoinTelegraphScraper(BaseScraper):
         """
         if not value_text:
             return None
-            
-        value_text = str(value_text).strip().replace(',', '')
-        
-        # Handle suffixes
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'B': 1_000_000_000,
-            'T': 1_000_000_000_000
-        }
-        
-        for suffix, multiplier in multipliers.items():
-            if value_text.endswith(suffix):
-                try:
-                    return float(value_text[:-1]) * multiplier
-                except ValueError:
-                    return None
-        
-        # Handle currency symbols
-        value_text = re.sub(r'[^\d.-]', '', value_text)
-        
-        # No suffix, try to convert directly
-        try:
-            if '.' in value_text:
-                return float(value_text)
-            else:
-                return int(value_text)
-        except ValueError:
-            return None
+        return _parse_value_text(str(value_text).strip())
     
     @staticmethod
     def _parse_percent(percent_text: Optional[str]) -> Optional[float]:
@@ -388,12 +469,61 @@ class CoinTelegraphScraper(BaseScraper):
         """
         if not percent_text:
             return None
-            
-        # Remove any non-numeric characters except for the decimal point and minus sign
-        percent_text = str(percent_text)
-        percent_text = re.sub(r'[^\d.-]', '', percent_text)
+        return _parse_percent_text(str(percent_text).strip())
+
+
+def _parse_tag_html(content: bytes, encoding: Optional[str], max_articles: int) -> Dict:
+    """
+    Parse a raw CoinTelegraph tag page into news data.
+    
+    Module-level so that it can be pickled and run in a worker process.
+    
+    Args:
+        content: Raw page content
+        encoding: Encoding declared by the server, if any
+        max_articles: Maximum number of articles to extract
         
+    Returns:
+        Dictionary with scraped news data for the tag
+    """
+    soup = BeautifulSoup(content, 'lxml', from_encoding=encoding)
+    return CoinTelegraphScraper._parse_tag_page(soup, max_articles)
+
+
+# Price tables repeat the same cell strings ("0.00%", "$1.00", ...) across rows and
+# pages, so the parsed results are memoized on the normalized text.
+@lru_cache(maxsize=4096)
+def _parse_value_text(value_text: str) -> Optional[Union[int, float]]:
+    """Parse normalized value text for CoinTelegraphScraper._parse_value."""
+    if not value_text:
+        return None
+    
+    # Handle suffixes
+    multiplier = _SUFFIX_MULTIPLIERS.get(value_text[-1])
+    if multiplier:
         try:
-            return float(percent_text) / 100
+            return float(value_text[:-1].translate(_NUM_KEEP)) * multiplier
         except ValueError:
-            return None
\ No newline at end of file
+            return None
+    
+    # Strip currency symbols and thousands separators in a single pass
+    value_text = value_text.translate(_NUM_KEEP)
+    
+    # No suffix, try to convert directly
+    try:
+        if '.' in value_text:
+            return float(value_text)
+        else:
+            return int(value_text)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_percent_text(percent_text: str) -> Optional[float]:
+    """Parse normalized percentage text for CoinTelegraphScraper._parse_percent."""
+    # Remove any non-numeric characters except for the decimal point and minus sign
+    try:
+        return float(percent_text.translate(_NUM_KEEP)) / 100
+    except ValueError:
+        return None
@@ -5,7 +5,11 @@ This module provides functionality for scraping cryptocurrency news from CryptoP
 """
 
 import logging
+import math
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
@@ -15,6 +19,10 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Fields kept from the API's per-post vote counts and currency entries
+_VOTE_FIELDS = ('negative', 'positive', 'important', 'liked', 'disliked', 'lol', 'toxic', 'saved')
+_CURRENCY_FIELDS = ('code', 'title', 'slug', 'url')
+
 
 class CryptoPanicScraper(BaseScraper):
     """
@@ -27,6 +35,7 @@ class CryptoPanicScraper(BaseScraper):
     BASE_URL = "https://cryptopanic.com/api/v1"
     NEWS_URL = BASE_URL + "/posts"
     FREE_NEWS_URL = BASE_URL + "/posts/?public=true"
+    MAX_CONCURRENT_PAGES = 4
     
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """
@@ -37,8 +46,9 @@ class CryptoPanicScraper(BaseScraper):
         """
         super().__init__(**kwargs)
         self.api_key = api_key
-        self.last_request_time = 0
+        self.last_request_time = 0.0  # time.monotonic() of the most recently reserved request slot
         self.min_request_interval = 1  # 1 second between requests to be respectful
+        self._rate_lock = threading.Lock()
     
     def _rate_limited_request(self, url: str, params: Optional[Dict] = None) -> requests.Response:
         """
@@ -51,12 +61,16 @@ class CryptoPanicScraper(BaseScraper):
         Returns:
             Response object
         """
-        # Ensure we don't make requests too quickly
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        # Reserve the next free request slot under the lock, then sleep outside it so
+        # concurrent callers queue up one interval apart instead of firing together.
+        # The monotonic clock is immune to wall-clock adjustments.
+        with self._rate_lock:
+            current_time = time.monotonic()
+            slot = max(current_time, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
+        sleep_time = slot - current_time
+        if sleep_time > 0:
             time.sleep(sleep_time)
         
         # Add API key to params if available
@@ -64,13 +78,7 @@ class CryptoPanicScraper(BaseScraper):
             params = params or {}
             params['auth_token'] = self.api_key
         
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()]) if params else ''
-        full_url = url + ('&' + query_string if '?' in url and query_string else '?' + query_string if query_string else '')
-        
-        response = self._make_request(full_url)
-        self.last_request_time = time.time()
-        
-        return response
+        return self._make_request(url, params=params)
     
     def scrape(self, 
                cryptocurrencies: Optional[List[str]] = None, 
@@ -158,42 +166,42 @@ class CryptoPanicScraper(BaseScraper):
             # Use authenticated endpoint if API key is available
             url = self.NEWS_URL if self.api_key else self.FREE_NEWS_URL
             
-            posts = []
-            page = 1
-            posts_per_page = min(max_posts, 20)  # API typically returns 20 posts per page
+            # Probe the first page to learn the page size and total count, then fetch the
+            # remaining pages concurrently (still spaced out by the rate limiter)
+            first_page = self._fetch_page(url, params, 1)
+            if first_page is None:
+                return []
+            
+            pages = [first_page['results']]
+            page_size = len(first_page['results'])
             
-            while len(posts) < max_posts:
-                params['page'] = str(page)
+            if page_size and first_page.get('next') and page_size < max_posts:
+                total_pages = math.ceil(max_posts / page_size)
+                if first_page.get('count'):
+                    total_pages = min(total_pages, math.ceil(first_page['count'] / page_size))
                 
-                try:
-                    response = self._rate_limited_request(url, params)
-                    data = response.json()
-                    
-                    if 'results' not in data:
-                        logger.warning("No results found in API response")
-                        break
-                    
-                    page_posts = data['results']
-                    if not page_posts:
-                        break  # No more posts
-                    
-                    for post in page_posts:
-                        if len(posts) >= max_posts:
-                            break
-                        
-                        processed_post = self._process_post(post)
-                        if processed_post:
-                            posts.append(processed_post)
-                    
-                    # Check if there are more pages
-                    if not data.get('next'):
+                if total_pages > 1:
+                    workers = min(self.MAX_CONCURRENT_PAGES, total_pages - 1)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        remaining = executor.map(
+                            lambda page: self._fetch_page(url, params, page),
+                            range(2, total_pages + 1)
+                        )
+                        # Keep page order and stop at the first missing page, as a serial walk would
+                        for data in remaining:
+                            if not data or not data['results']:
+                                break
+                            pages.append(data['results'])
+            
+            posts = []
+            for page_posts in pages:
+                for post in page_posts:
+                    if len(posts) >= max_posts:
                         break
                     
-                    page += 1
-                
-                except Exception as e:
-                    logger.error(f"Error fetching page {page}: {e}")
-                    break
+                    processed_post = self._process_post(post)
+                    if processed_post:
+                        posts.append(processed_post)
             
             return posts
         
@@ -201,6 +209,32 @@ class CryptoPanicScraper(BaseScraper):
             logger.error(f"Error scraping news posts: {e}")
             return []
     
+    def _fetch_page(self, url: str, params: Dict, page: int) -> Optional[Dict]:
+        """
+        Fetch a single page of posts.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters shared by all pages
+            page: Page number to fetch
+            
+        Returns:
+            Decoded API response, or None if the request failed or had no results
+        """
+        try:
+            response = self._rate_limited_request(url, {**params, 'page': str(page)})
+            data = response.json()
+            
+            if 'results' not in data:
+                logger.warning("No results found in API response")
+                return None
+            
+            return data
+        
+        except Exception as e:
+            logger.error(f"Error fetching page {page}: {e}")
+            return None
+    
     def _process_post(self, post: Dict) -> Optional[Dict]:
         """
         Process a single post from the API response.
@@ -224,40 +258,25 @@ class CryptoPanicScraper(BaseScraper):
             }
             
             # Extract votes (sentiment indicators)
-            votes = post.get('votes', {})
-            processed["votes"] = {
-                "negative": votes.get('negative', 0),
-                "positive": votes.get('positive', 0),
-                "important": votes.get('important', 0),
-                "liked": votes.get('liked', 0),
-                "disliked": votes.get('disliked', 0),
-                "lol": votes.get('lol', 0),
-                "toxic": votes.get('toxic', 0),
-                "saved": votes.get('saved', 0)
-            }
+            raw_votes = post.get('votes') or {}
+            votes = {field: raw_votes.get(field, 0) for field in _VOTE_FIELDS}
+            processed["votes"] = votes
             
             # Calculate sentiment score
-            total_votes = sum(processed["votes"].values())
+            total_votes = sum(votes.values())
             if total_votes > 0:
-                positive_score = (votes.get('positive', 0) + votes.get('important', 0) + votes.get('liked', 0)) / total_votes
-                negative_score = (votes.get('negative', 0) + votes.get('disliked', 0) + votes.get('toxic', 0)) / total_votes
-                processed["sentiment_score"] = positive_score - negative_score
+                positive_votes = votes['positive'] + votes['important'] + votes['liked']
+                negative_votes = votes['negative'] + votes['disliked'] + votes['toxic']
+                processed["sentiment_score"] = (positive_votes - negative_votes) / total_votes
             else:
                 processed["sentiment_score"] = 0
             
             # Extract currencies mentioned
-            currencies = post.get('currencies', [])
-            processed["currencies"] = []
-            for currency in currencies:
-                if isinstance(currency, dict):
-                    processed["currencies"].append({
-                        "code": currency.get('code', ''),
-                        "title": currency.get('title', ''),
-                        "slug": currency.get('slug', ''),
-                        "url": currency.get('url', '')
-                    })
-                else:
-                    processed["currencies"].append({"code": str(currency)})
+            processed["currencies"] = [
+                {field: currency.get(field, '') for field in _CURRENCY_FIELDS}
+                if isinstance(currency, dict) else {"code": str(currency)}
+                for currency in post.get('currencies', [])
+            ]
             
             # Extract metadata
             metadata = post.get('metadata', {})
@@ -325,21 +344,25 @@ class CryptoPanicScraper(BaseScraper):
             sentiment_data = {}
             
             if cryptocurrencies:
+                # Bucket post scores by currency code in a single pass over the posts
+                scores_by_code = defaultdict(list)
+                for post in posts:
+                    score = post.get('sentiment_score', 0)
+                    codes = {c.get('code', '').upper() for c in post.get('currencies', [])}
+                    for code in codes:
+                        scores_by_code[code].append(score)
+                
                 for crypto in cryptocurrencies:
                     crypto_upper = crypto.upper()
-                    crypto_posts = [
-                        post for post in posts 
-                        if any(c.get('code', '').upper() == crypto_upper for c in post.get('currencies', []))
-                    ]
+                    sentiment_scores = scores_by_code.get(crypto_upper)
                     
-                    if crypto_posts:
-                        sentiment_scores = [post.get('sentiment_score', 0) for post in crypto_posts]
+                    if sentiment_scores:
                         avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
                         
                         sentiment_data[crypto_upper] = {
                             "average_sentiment": avg_sentiment,
-                            "total_posts": len(crypto_posts),
-                            "sentiment_distribution": self._calculate_sentiment_distribution(crypto_posts)
+                            "total_posts": len(sentiment_scores),
+                            "sentiment_distribution": self._calculate_score_distribution(sentiment_scores)
                         }
             else:
                 # Overall sentiment
@@ -369,16 +392,29 @@ class CryptoPanicScraper(BaseScraper):
         Args:
             posts: List of posts
             
+        Returns:
+            Dictionary with sentiment distribution
+        """
+        return self._calculate_score_distribution([post.get('sentiment_score', 0) for post in posts])
+    
+    @staticmethod
+    def _calculate_score_distribution(scores: List[float]) -> Dict:
+        """
+        Calculate sentiment distribution from sentiment scores.
+        
+        Args:
+            scores: List of post sentiment scores
+            
         Returns:
             Dictionary with sentiment distribution
         """
         try:
-            total_posts = len(posts)
+            total_posts = len(scores)
             if total_posts == 0:
                 return {"positive": 0, "neutral": 0, "negative": 0}
             
-            positive = sum(1 for post in posts if post.get('sentiment_score', 0) > 0.1)
-            negative = sum(1 for post in posts if post.get('sentiment_score', 0) < -0.1)
+            positive = sum(1 for score in scores if score > 0.1)
+            negative = sum(1 for score in scores if score < -0.1)
             neutral = total_posts - positive - negative
             
             return {
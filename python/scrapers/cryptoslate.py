@@ -7,15 +7,130 @@ This module provides functionality for scraping cryptocurrency news and data fro
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
-from bs4 import BeautifulSoup
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, compile_class_selector
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import time rather than on every parsed element
+_NUMBER_RE = re.compile(r'[\d,]+\.?\d*')
+_INTEGER_RE = re.compile(r'[\d,]+')
+# Each named group is the stats key its labels map to
+_STATS_CLASSIFY_RE = re.compile(
+    r'(?P<total_market_cap>total market cap|market capitalization)'
+    r'|(?P<total_volume>total volume|24h volume)'
+    r'|(?P<active_cryptocurrencies>cryptocurrencies|coins)',
+    re.IGNORECASE
+)
+# Priority of the stats keys for text naming several stats (lower wins)
+_STATS_PRIORITY = {'total_market_cap': 0, 'total_volume': 1, 'active_cryptocurrencies': 2}
+_PRICE_CLEAN_RE = re.compile(r'[^\d.-]')
+_PCT_CLEAN_RE = re.compile(r'[^\d.+-]')
+_NUMBER_SUFFIX_RE = re.compile(r'([+-]?(?:\d[\d,]*)?\.?\d+)\s*([KMBT]?)', re.IGNORECASE)
+_SUFFIX_MULTIPLIERS = {'': 1, 'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+
+# CSS selectors compiled once; soupsieve matches them in one pass per element
+_HEADINGS = ['h1', 'h2', 'h3', 'h4']
+# Article container selectors in order of preference; only the elements matching the
+# first one that matches anything are used, so a .post-item nested in an <article> is
+# not returned as a second article
+_ARTICLE_SELECTOR_PRIORITY = (
+    'article',
+    '.post-item',
+    '.news-item',
+    '.article-item',
+    '[class*="article"]',
+    '[class*="post"]',
+    # No specific containers: divs with an article-like class
+    'div[class*="article"], div[class*="post"], div[class*="news"]',
+)
+# Union of the above, so the page is walked once to collect every candidate
+_ARTICLE_SELECTOR = soupsieve.compile(', '.join(_ARTICLE_SELECTOR_PRIORITY))
+_ARTICLE_SELECTORS = tuple(soupsieve.compile(selector) for selector in _ARTICLE_SELECTOR_PRIORITY)
+# Strainers building only the elements the selectors above can match: <article> tags
+# first, then (if there are none) elements with an article-like class
+_ARTICLE_STRAINER = SoupStrainer('article')
+_NEWS_STRAINER = SoupStrainer(class_=re.compile(r'article|post|news'))
+_TITLE_SELECTOR = compile_class_selector(['title', 'headline'], _HEADINGS)
+_DATE_SELECTOR = compile_class_selector(['date', 'time'])
+_AUTHOR_SELECTOR = compile_class_selector(['author', 'byline'])
+_SUMMARY_SELECTOR = compile_class_selector(['summary', 'excerpt', 'description'], ['p'])
+_TAG_SELECTOR = compile_class_selector(['tag', 'category'])
+_BODY_SELECTOR = compile_class_selector(['entry-content', 'post-content', 'article-content', 'article-body'])
+
+# Stats whose value is a plain integer count rather than a suffixed amount
+_COUNT_STATS = frozenset({'active_cryptocurrencies'})
+
+# Market table columns: (output key, header keywords, parser method or None for plain text)
+_TABLE_COLUMNS = (
+    ('name', ('name', 'coin', 'cryptocurrency'), None),
+    ('symbol', ('symbol', 'ticker'), None),
+    ('price', ('price', 'value'), '_parse_price'),
+    ('change_24h', ('change', '24h', 'change 24h', '24h change'), '_parse_percentage'),
+    ('volume_24h', ('volume', '24h volume', 'volume 24h'), '_parse_number'),
+    ('market_cap', ('market cap', 'marketcap', 'cap'), '_parse_number'),
+)
+
+# The markets page is parsed with lxml directly; its XPath lookups are compiled once
+_TABLE_XPATH = etree.XPath("(//table)[1]")
+_ROW_XPATH = etree.XPath(".//tr")
+_CELL_XPATH = etree.XPath(".//td|.//th")
+_STAT_XPATH = etree.XPath(
+    "//*[contains(@class, 'stat') or contains(@class, 'metric') or contains(@class, 'total')]"
+)
+
+
+def _text(node) -> str:
+    """Get the stripped text of an lxml or BeautifulSoup node."""
+    if isinstance(node, lxml.html.HtmlElement):
+        # Strip each text piece and join them without a separator, like get_text(strip=True)
+        return ''.join(text.strip() for text in node.itertext())
+    return node.get_text(strip=True)
+
+
+@lru_cache(maxsize=4096)
+def _parse_price_text(price_str: str) -> float:
+    """Parse price string to float."""
+    try:
+        clean_price = _PRICE_CLEAN_RE.sub('', price_str.replace(',', ''))
+        return float(clean_price) if clean_price else 0.0
+    except (ValueError, AttributeError):
+        return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _parse_percentage_text(percent_str: str) -> float:
+    """Parse percentage string to float."""
+    try:
+        clean_percent = _PCT_CLEAN_RE.sub('', percent_str)
+        return float(clean_percent) if clean_percent else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _parse_number_text(number_str: str) -> float:
+    """Parse number string (possibly with K, M, B suffixes) to float."""
+    try:
+        # One search finds the number and its K/M/B/T suffix, skipping currency symbols
+        number_match = _NUMBER_SUFFIX_RE.search(number_str)
+        if not number_match:
+            return 0.0
+        
+        number, suffix = number_match.groups()
+        return float(number.replace(',', '')) * _SUFFIX_MULTIPLIERS[suffix.upper()]
+    except (ValueError, TypeError):
+        return 0.0
+
 
 class CryptoSlateScraper(BaseScraper):
     """
@@ -28,6 +143,7 @@ class CryptoSlateScraper(BaseScraper):
     NEWS_URL = BASE_URL + "/news"
     COINS_URL = BASE_URL + "/coins"
     MARKETS_URL = BASE_URL + "/markets"
+    MAX_CONCURRENT_FETCHES = 8
     
     def __init__(self, **kwargs):
         """Initialize the CryptoSlate scraper with base scraper parameters."""
@@ -50,11 +166,17 @@ class CryptoSlateScraper(BaseScraper):
             "source": "CryptoSlate"
         }
         
-        if include_news:
-            result["news"] = self.scrape_crypto_news(max_articles)
-        
-        if include_market_data:
-            result["market_data"] = self.scrape_market_data()
+        # News and market pages are independent requests, so fetch them concurrently;
+        # both methods catch their own errors and return an error dict instead of raising
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            news_future = executor.submit(self.scrape_crypto_news, max_articles) if include_news else None
+            market_future = executor.submit(self.scrape_market_data) if include_market_data else None
+            
+            if news_future:
+                result["news"] = news_future.result()
+            
+            if market_future:
+                result["market_data"] = market_future.result()
         
         return result
     
@@ -69,30 +191,16 @@ class CryptoSlateScraper(BaseScraper):
             Dictionary with scraped news data
         """
         try:
-            soup = self.get_html(self.NEWS_URL)
-            
-            articles = []
+            response = self._make_request(self.NEWS_URL)
             
-            # Look for article containers
-            article_selectors = [
-                'article',
-                '.post-item',
-                '.news-item',
-                '.article-item',
-                '[class*="article"]',
-                '[class*="post"]'
-            ]
-            
-            article_elements = []
-            for selector in article_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    article_elements = elements
-                    break
-            
-            # If no specific containers found, look for divs with article-like structure
+            # Only build the article-like regions of the page; navigation, scripts and
+            # footers are skipped by the parser. The page is fetched once and parsed
+            # again for class-based containers only if it has no <article> tags.
+            article_elements = self._find_article_elements(self.parse_html(response, _ARTICLE_STRAINER))
             if not article_elements:
-                article_elements = soup.find_all('div', class_=re.compile(r'.*article.*|.*post.*|.*news.*'))
+                article_elements = self._find_article_elements(self.parse_html(response, _NEWS_STRAINER))
+            
+            articles = []
             
             for article in article_elements[:max_articles]:
                 try:
@@ -114,6 +222,74 @@ class CryptoSlateScraper(BaseScraper):
             logger.error(f"Error scraping news from CryptoSlate: {e}")
             return {"articles": [], "total_count": 0, "error": str(e)}
     
+    @staticmethod
+    def _find_article_elements(soup: BeautifulSoup) -> List:
+        """
+        Find the article containers on a news page.
+        
+        Args:
+            soup: BeautifulSoup object of the page
+            
+        Returns:
+            List of article elements
+        """
+        # One pass over the page collects every candidate container; the selectors in
+        # order of preference then only test those candidates, not the whole page
+        candidates = _ARTICLE_SELECTOR.select(soup)
+        for selector in _ARTICLE_SELECTORS:
+            article_elements = [element for element in candidates if selector.match(element)]
+            if article_elements:
+                return article_elements
+        
+        return []
+    
+    def scrape_article_bodies(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Scrape the full text of several articles concurrently.
+        
+        Article pages are fetched on a bounded thread pool, so N pages take about
+        N / MAX_CONCURRENT_FETCHES round trips instead of N.
+        
+        Args:
+            urls: Article URLs, e.g. the 'link' values returned by scrape_crypto_news
+            
+        Returns:
+            Dictionary mapping each URL to its article body data
+        """
+        if not urls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_FETCHES, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self._scrape_article_body, urls)))
+    
+    def _scrape_article_body(self, url: str) -> Dict:
+        """
+        Scrape the body text of a single article.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            Dictionary with the article content, or an error entry if the fetch failed
+        """
+        try:
+            soup = self.get_html(url)
+            
+            container = _BODY_SELECTOR.select_one(soup) or soup.find('article') or soup
+            paragraphs = (p.get_text(' ', strip=True) for p in container.find_all('p'))
+            content = "\n\n".join(text for text in paragraphs if text)
+            
+            return {
+                "url": url,
+                "content": content,
+                "word_count": len(content.split()),
+                "scraped_at": datetime.now().isoformat()
+            }
+        
+        except Exception as e:
+            logger.warning(f"Error scraping article {url}: {e}")
+            return {"url": url, "content": "", "error": str(e)}
+    
     def scrape_market_data(self) -> Dict:
         """
         Scrape market data from CryptoSlate.
@@ -122,7 +298,8 @@ class CryptoSlateScraper(BaseScraper):
             Dictionary with market data
         """
         try:
-            soup = self.get_html(self.MARKETS_URL)
+            # The markets page is mostly one large table, so skip BeautifulSoup here
+            tree = self.get_html_tree(self.MARKETS_URL)
             
             market_data = {
                 "cryptocurrencies": [],
@@ -130,12 +307,12 @@ class CryptoSlateScraper(BaseScraper):
             }
             
             # Look for cryptocurrency table or list
-            table = soup.find('table')
-            if table:
-                market_data["cryptocurrencies"] = self._parse_crypto_table(table)
+            tables = _TABLE_XPATH(tree)
+            if tables:
+                market_data["cryptocurrencies"] = self._parse_crypto_table(tables[0])
             
             # Look for market statistics
-            stats = self._extract_market_stats(soup)
+            stats = self._extract_market_stats(tree)
             if stats:
                 market_data["market_stats"] = stats
             
@@ -157,14 +334,14 @@ class CryptoSlateScraper(BaseScraper):
         """
         try:
             # Extract title
-            title_elem = article.find(['h1', 'h2', 'h3', 'h4'], class_=re.compile(r'.*title.*|.*headline.*'))
+            title_elem = _TITLE_SELECTOR.select_one(article)
             if not title_elem:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4'])
             
             if not title_elem:
                 return None
             
-            title = title_elem.get_text(strip=True)
+            title = _text(title_elem)
             
             # Extract link
             link_elem = title_elem.find('a') if title_elem else article.find('a')
@@ -176,36 +353,36 @@ class CryptoSlateScraper(BaseScraper):
             # Extract date
             date_elem = article.find('time')
             if not date_elem:
-                date_elem = article.find(class_=re.compile(r'.*date.*|.*time.*'))
+                date_elem = _DATE_SELECTOR.select_one(article)
             
             date = ""
             if date_elem:
-                date = date_elem.get('datetime') or date_elem.get_text(strip=True)
+                date = date_elem.get('datetime') or _text(date_elem)
             
             # Extract author
-            author_elem = article.find(class_=re.compile(r'.*author.*|.*byline.*'))
-            author = author_elem.get_text(strip=True) if author_elem else ""
+            author_elem = _AUTHOR_SELECTOR.select_one(article)
+            author = _text(author_elem) if author_elem else ""
             
             # Extract summary/excerpt
-            summary_elem = article.find(['p'], class_=re.compile(r'.*summary.*|.*excerpt.*|.*description.*'))
+            summary_elem = _SUMMARY_SELECTOR.select_one(article)
+            summary = _text(summary_elem) if summary_elem else ""
             if not summary_elem:
                 # Look for the first paragraph that's not part of metadata
-                paragraphs = article.find_all('p')
-                for p in paragraphs:
-                    p_text = p.get_text(strip=True)
+                for p in article.find_all('p'):
+                    p_text = _text(p)
                     if len(p_text) > 50 and not any(keyword in p_text.lower() for keyword in ['by ', 'posted', 'published']):
-                        summary_elem = p
+                        summary = p_text
                         break
             
-            summary = summary_elem.get_text(strip=True) if summary_elem else ""
-            
             # Extract tags/categories
             tags = []
-            tag_elements = article.find_all(class_=re.compile(r'.*tag.*|.*category.*'))
+            tag_elements = _TAG_SELECTOR.select(article)
             for tag_elem in tag_elements:
-                tag_text = tag_elem.get_text(strip=True)
+                tag_text = _text(tag_elem)
                 if tag_text and len(tag_text) < 50:  # Avoid picking up long text as tags
                     tags.append(tag_text)
+                    if len(tags) == 5:
+                        break
             
             return {
                 "title": title,
@@ -213,7 +390,7 @@ class CryptoSlateScraper(BaseScraper):
                 "date": date,
                 "author": author,
                 "summary": summary[:500],  # Limit summary length
-                "tags": tags[:5],  # Limit number of tags
+                "tags": tags,  # At most 5 tags
                 "source": "CryptoSlate"
             }
         
@@ -221,12 +398,12 @@ class CryptoSlateScraper(BaseScraper):
             logger.warning(f"Error extracting article data: {e}")
             return None
     
-    def _parse_crypto_table(self, table) -> List[Dict]:
+    def _parse_crypto_table(self, table: lxml.html.HtmlElement) -> List[Dict]:
         """
         Parse cryptocurrency data from a table.
         
         Args:
-            table: BeautifulSoup table element
+            table: lxml table element
             
         Returns:
             List of cryptocurrency data dictionaries
@@ -234,62 +411,33 @@ class CryptoSlateScraper(BaseScraper):
         cryptocurrencies = []
         
         try:
-            rows = table.find_all('tr')
+            rows = _ROW_XPATH(table)
             header_row = rows[0] if rows else None
             
             # Try to identify column indices
             headers = []
-            if header_row:
-                headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
-            
-            # Common column mappings
-            col_mapping = {
-                'name': ['name', 'coin', 'cryptocurrency'],
-                'symbol': ['symbol', 'ticker'],
-                'price': ['price', 'value'],
-                'change': ['change', '24h', 'change 24h', '24h change'],
-                'volume': ['volume', '24h volume', 'volume 24h'],
-                'market_cap': ['market cap', 'marketcap', 'cap']
-            }
+            if header_row is not None:
+                headers = [_text(th).lower() for th in _CELL_XPATH(header_row)]
             
-            # Find column indices
-            col_indices = {}
-            for field, keywords in col_mapping.items():
+            # Resolve each known column to its index and parser once, so rows are
+            # handled by a single loop over the columns actually present
+            extractors = []
+            for key, keywords, parser_name in _TABLE_COLUMNS:
                 for i, header in enumerate(headers):
                     if any(keyword in header for keyword in keywords):
-                        col_indices[field] = i
+                        parser = getattr(self, parser_name) if parser_name else str
+                        extractors.append((key, i, parser))
                         break
             
             # Parse data rows
             for row in rows[1:]:  # Skip header row
-                cells = row.find_all(['td', 'th'])
+                cells = [_text(cell) for cell in _CELL_XPATH(row)]
                 if len(cells) < 2:
                     continue
                 
-                crypto_data = {}
-                
-                # Extract data based on column indices
-                if 'name' in col_indices and len(cells) > col_indices['name']:
-                    crypto_data['name'] = cells[col_indices['name']].get_text(strip=True)
-                
-                if 'symbol' in col_indices and len(cells) > col_indices['symbol']:
-                    crypto_data['symbol'] = cells[col_indices['symbol']].get_text(strip=True)
-                
-                if 'price' in col_indices and len(cells) > col_indices['price']:
-                    price_text = cells[col_indices['price']].get_text(strip=True)
-                    crypto_data['price'] = self._parse_price(price_text)
-                
-                if 'change' in col_indices and len(cells) > col_indices['change']:
-                    change_text = cells[col_indices['change']].get_text(strip=True)
-                    crypto_data['change_24h'] = self._parse_percentage(change_text)
-                
-                if 'volume' in col_indices and len(cells) > col_indices['volume']:
-                    volume_text = cells[col_indices['volume']].get_text(strip=True)
-                    crypto_data['volume_24h'] = self._parse_number(volume_text)
-                
-                if 'market_cap' in col_indices and len(cells) > col_indices['market_cap']:
-                    cap_text = cells[col_indices['market_cap']].get_text(strip=True)
-                    crypto_data['market_cap'] = self._parse_number(cap_text)
+                crypto_data = {
+                    key: parser(cells[i]) for key, i, parser in extractors if i < len(cells)
+                }
                 
                 # Only add if we have at least name or symbol
                 if crypto_data.get('name') or crypto_data.get('symbol'):
@@ -301,12 +449,12 @@ class CryptoSlateScraper(BaseScraper):
         
         return cryptocurrencies
     
-    def _extract_market_stats(self, soup: BeautifulSoup) -> Dict:
+    def _extract_market_stats(self, tree: lxml.html.HtmlElement) -> Dict:
         """
         Extract general market statistics from the page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: lxml root element of the page
             
         Returns:
             Dictionary with market statistics
@@ -315,69 +463,42 @@ class CryptoSlateScraper(BaseScraper):
         
         try:
             # Look for market cap, volume, etc.
-            stat_elements = soup.find_all(class_=re.compile(r'.*stat.*|.*metric.*|.*total.*'))
+            stat_elements = _STAT_XPATH(tree)
             
             for elem in stat_elements:
-                text = elem.get_text(strip=True)
+                text = _text(elem)
                 
-                # Try to extract total market cap
-                if any(keyword in text.lower() for keyword in ['total market cap', 'market capitalization']):
-                    number_match = re.search(r'[\d,]+\.?\d*', text)
-                    if number_match:
-                        stats['total_market_cap'] = self._parse_number(number_match.group())
+                # One scan finds every label; text naming several stats is classified as
+                # market cap, volume or coin count in that order, not by label position
+                keyword_match = min(
+                    _STATS_CLASSIFY_RE.finditer(text),
+                    key=lambda match: _STATS_PRIORITY[match.lastgroup],
+                    default=None
+                )
+                if not keyword_match:
+                    continue
+                
+                stat = keyword_match.lastgroup
+                is_count = stat in _COUNT_STATS
+                number_re = _INTEGER_RE if is_count else _NUMBER_RE
                 
-                # Try to extract total volume
-                elif any(keyword in text.lower() for keyword in ['total volume', '24h volume']):
-                    number_match = re.search(r'[\d,]+\.?\d*', text)
-                    if number_match:
-                        stats['total_volume'] = self._parse_number(number_match.group())
+                # Prefer the number after the label, so '24h volume' does not yield 24
+                number_match = number_re.search(text, keyword_match.end()) or number_re.search(text)
+                if not number_match:
+                    continue
                 
-                # Try to extract number of cryptocurrencies
-                elif any(keyword in text.lower() for keyword in ['cryptocurrencies', 'coins']):
-                    number_match = re.search(r'[\d,]+', text)
-                    if number_match:
-                        stats['active_cryptocurrencies'] = int(number_match.group().replace(',', ''))
+                if is_count:
+                    stats[stat] = int(number_match.group().replace(',', ''))
+                else:
+                    stats[stat] = self._parse_number(number_match.group())
         
         except Exception as e:
             logger.warning(f"Error extracting market stats: {e}")
         
         return stats
     
-    def _parse_price(self, price_str: str) -> float:
-        """Parse price string to float."""
-        try:
-            clean_price = re.sub(r'[^\d.-]', '', price_str.replace(',', ''))
-            return float(clean_price) if clean_price else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
-    
-    def _parse_percentage(self, percent_str: str) -> float:
-        """Parse percentage string to float."""
-        try:
-            clean_percent = re.sub(r'[^\d.+-]', '', percent_str)
-            return float(clean_percent) if clean_percent else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
-    
-    def _parse_number(self, number_str: str) -> float:
-        """Parse number string (possibly with K, M, B suffixes) to float."""
-        try:
-            # Remove currency symbols and spaces
-            clean_str = re.sub(r'[^\d.KMBTkmbt+-]', '', number_str.upper())
-            
-            # Extract number part
-            number_match = re.match(r'([+-]?[\d.]+)([KMBT]?)', clean_str)
-            if not number_match:
-                return 0.0
-            
-            number = float(number_match.group(1))
-            suffix = number_match.group(2)
-            
-            # Apply multiplier based on suffix
-            multipliers = {'K': 1000, 'M': 1000000, 'B': 1000000000, 'T': 1000000000000}
-            if suffix in multipliers:
-                number *= multipliers[suffix]
-            
-            return number
-        except (ValueError, AttributeError):
-            return 0.0
+    # Market tables repeat many cell values ("0.00%", "--", equal volumes), so the
+    # parsers are memoized module-level functions
+    _parse_price = staticmethod(_parse_price_text)
+    _parse_percentage = staticmethod(_parse_percentage_text)
+    _parse_number = staticmethod(_parse_number_text)
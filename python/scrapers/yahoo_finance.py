@@ -6,16 +6,27 @@ This module provides functionality for scraping financial data from Yahoo Financ
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Number (with optional thousands separators) followed by an optional magnitude suffix
+_VALUE_RE = re.compile(r'([-+]?(?:[\d,]+\.?\d*|\.\d+))([KMBT]?)')
+_SUFFIX_MULTIPLIERS = {
+    'K': 1_000,
+    'M': 1_000_000,
+    'B': 1_000_000_000,
+    'T': 1_000_000_000_000
+}
+
 
 class YahooFinanceScraper(BaseScraper):
     """
@@ -28,15 +39,31 @@ class YahooFinanceScraper(BaseScraper):
     BASE_URL = "https://finance.yahoo.com"
     QUOTE_URL = BASE_URL + "/quote/{symbol}"
     HISTORICAL_URL = BASE_URL + "/quote/{symbol}/history"
+    MAX_CONCURRENT_FETCHES = 8
     
-    def __init__(self, **kwargs):
-        """Initialize the Yahoo Finance scraper with base scraper parameters."""
+    def __init__(self, max_workers: int = MAX_CONCURRENT_FETCHES, **kwargs):
+        """
+        Initialize the Yahoo Finance scraper.
+        
+        Args:
+            max_workers: Maximum number of symbols fetched concurrently
+            **kwargs: Base scraper parameters
+        """
         super().__init__(**kwargs)
+        self.max_workers = max(1, max_workers)
+        
+        # Keep one pooled connection per worker so concurrent fetches reuse connections
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def scrape(self, symbols: List[str], data_points: Optional[List[str]] = None) -> Dict[str, Dict]:
         """
         Scrape data for multiple symbols.
         
+        Symbols are fetched on a bounded thread pool, so N symbols take about
+        N / max_workers round trips instead of N.
+        
         Args:
             symbols: List of stock symbols to scrape
             data_points: List of data points to include (default: all)
@@ -49,16 +76,19 @@ class YahooFinanceScraper(BaseScraper):
             "market_cap", "pe_ratio", "dividend_yield"
         ]
         
-        result = {}
-        for symbol in symbols:
+        if not symbols:
+            return {}
+        
+        def scrape_one(symbol: str) -> Dict:
             try:
                 logger.info(f"Scraping data for {symbol}")
-                result[symbol] = self.scrape_symbol(symbol, data_points)
+                return self.scrape_symbol(symbol, data_points)
             except Exception as e:
                 logger.error(f"Error scraping {symbol}: {e}")
-                result[symbol] = {"error": str(e)}
+                return {"error": str(e)}
         
-        return result
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols))) as executor:
+            return dict(zip(symbols, executor.map(scrape_one, symbols)))
     
     def scrape_symbol(self, symbol: str, data_points: List[str]) -> Dict:
         """
@@ -250,31 +280,23 @@ class YahooFinanceScraper(BaseScraper):
         Returns:
             Parsed numeric value
         """
-        if not value_text or value_text.strip() == 'N/A':
+        if not value_text:
             return None
-            
-        value_text = value_text.strip().replace(',', '')
         
-        # Handle suffixes
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'B': 1_000_000_000,
-            'T': 1_000_000_000_000
-        }
+        # A single match splits the number from its suffix; 'N/A' and other text do not match
+        match = _VALUE_RE.fullmatch(value_text.strip())
+        if not match:
+            return None
         
-        for suffix, multiplier in multipliers.items():
-            if value_text.endswith(suffix):
-                try:
-                    return float(value_text[:-1]) * multiplier
-                except ValueError:
-                    return None
+        number, suffix = match.groups()
+        number = number.replace(',', '')
         
-        # No suffix, try to convert directly
         try:
-            if '.' in value_text:
-                return float(value_text)
+            if suffix:
+                return float(number) * _SUFFIX_MULTIPLIERS[suffix]
+            elif '.' in number:
+                return float(number)
             else:
-                return int(value_text)
+                return int(number)
         except ValueError:
             return None
\ No newline at end of file
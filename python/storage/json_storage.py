@@ -7,13 +7,148 @@ This module provides functionality for storing financial data in JSON files.
 import json
 import logging
 import os
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Datetimes are passed through to _json_default so they keep their str() form
+_ITEM_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+_DUMP_OPTIONS = _ITEM_OPTIONS | orjson.OPT_INDENT_2
+_LINE_OPTIONS = _ITEM_OPTIONS | orjson.OPT_APPEND_NEWLINE
+_PEEK_SIZE = 4096
+_NDJSON_EXTENSION = ".ndjson"
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert an object orjson cannot serialize natively.
+    
+    Dates and times are written as str(obj) (e.g. '2024-01-01 12:00:00'), as files
+    written with the json module were, rather than in orjson's RFC 3339 form.
+    
+    Args:
+        obj: Object to convert
+        
+    Returns:
+        JSON-serializable representation of the object
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return str(obj)
+    elif isinstance(obj, pd.DataFrame):
+        # Convert DataFrame to list of dictionaries
+        return obj.to_dict(orient='records')
+    elif hasattr(obj, 'to_dict'):
+        # Handle objects with to_dict method
+        return obj.to_dict()
+    elif hasattr(obj, '__dict__'):
+        # Handle objects with __dict__ attribute
+        return obj.__dict__
+    else:
+        # Convert to string as a fallback
+        return str(obj)
+
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        Encoded JSON document
+    """
+    return orjson.dumps(data, default=_json_default, option=_DUMP_OPTIONS)
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Parse a JSON document.
+    
+    orjson writes NaN and infinity as null. Files written by the json module may
+    contain bare NaN/Infinity tokens, which orjson rejects, so those are parsed with
+    the json module instead.
+    
+    Args:
+        raw: Encoded JSON document
+        
+    Returns:
+        Parsed data
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def _write_json(f, data: Any) -> None:
+    """
+    Write data to a binary file as JSON.
+    
+    Top-level lists are written one element per line, so only a single element is
+    ever serialized in memory, and the file can later be extended in place by
+    _append_to_json_list.
+    
+    Args:
+        f: File object opened in binary write mode
+        data: Data to write
+    """
+    if not isinstance(data, (list, tuple)):
+        f.write(_dumps(data))
+        return
+    
+    f.write(b'[')
+    separator = b'\n'
+    for item in data:
+        f.write(separator)
+        f.write(orjson.dumps(item, default=_json_default, option=_ITEM_OPTIONS))
+        separator = b',\n'
+    f.write(b'\n]' if data else b']')
+
+
+def _append_to_json_list(filepath: str, items: List[Any]) -> bool:
+    """
+    Append items to a JSON file whose root is a list, without reading the whole file.
+    
+    The items are written over the closing bracket, so the cost depends on the size
+    of the new items only, not on the size of the file.
+    
+    Args:
+        filepath: Path to an existing JSON file
+        items: Items to append
+        
+    Returns:
+        True if the items were appended, False if the root is not a list
+    """
+    with open(filepath, 'r+b') as f:
+        if not f.read(_PEEK_SIZE).lstrip().startswith(b'['):
+            return False
+        
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - _PEEK_SIZE)
+        f.seek(tail_start)
+        tail = f.read().rstrip()
+        body = tail[:-1].rstrip()
+        if not tail.endswith(b']') or (not body and tail_start > 0):
+            return False
+        
+        # Inside a list, only the opening bracket can directly precede the closing one
+        separator = b'\n' if body.endswith(b'[') else b',\n'
+        
+        f.seek(tail_start + len(body))
+        for item in items:
+            f.write(separator)
+            f.write(orjson.dumps(item, default=_json_default, option=_ITEM_OPTIONS))
+            separator = b',\n'
+        f.write(b'\n]')
+        f.truncate()
+    
+    return True
+
 
 class JSONStorage:
     """
@@ -55,12 +190,13 @@ class JSONStorage:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            # Convert data to a JSON-serializable format
-            json_data = self._prepare_for_json(data)
-                
-            # Save data to JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            # A DataFrame is stored as a list of records, so write it as one
+            if isinstance(data, pd.DataFrame):
+                data = data.to_dict(orient='records')
+            
+            # Save data to JSON file; unsupported objects are converted by _json_default
+            with open(filepath, 'wb') as f:
+                _write_json(f, data)
                 
             logger.info(f"Data stored in {filepath}")
             
@@ -116,8 +252,8 @@ class JSONStorage:
         
         try:
             # Load JSON from file
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
                 
             logger.info(f"Data loaded from {filepath}")
             
@@ -130,6 +266,9 @@ class JSONStorage:
         """
         Append data to an existing JSON file.
         
+        Filenames ending in .ndjson are handed to append_ndjson when no key is given,
+        which avoids reading and rewriting the whole file on every append.
+        
         Args:
             data: Data to append
             filename: Name of the JSON file (with or without extension)
@@ -138,6 +277,10 @@ class JSONStorage:
         Returns:
             Path to the JSON file
         """
+        # Line-delimited files are appended to without reading them back
+        if filename.endswith(_NDJSON_EXTENSION) and not key:
+            return self.append_ndjson(data, filename)
+        
         # Ensure the filename has the .json extension
         if not filename.endswith(".json"):
             filename += ".json"
@@ -145,14 +288,27 @@ class JSONStorage:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            # Convert data to a JSON-serializable format
-            json_data = self._prepare_for_json(data)
+            # Only the top level needs converting to decide between extend and update;
+            # nested objects are handled by _json_default at write time
+            if isinstance(data, tuple):
+                json_data = list(data)
+            elif isinstance(data, (list, dict, str, int, float, bool, type(None))):
+                json_data = data
+            else:
+                json_data = _json_default(data)
+            
+            # Appending to a root-level list only needs the end of the file rewritten
+            if not key and os.path.exists(filepath):
+                items = json_data if isinstance(json_data, list) else [json_data]
+                if _append_to_json_list(filepath, items):
+                    logger.info(f"Data appended to {filepath}")
+                    return filepath
             
             # Check if the file exists
             if os.path.exists(filepath):
                 # Load existing data
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                with open(filepath, 'rb') as f:
+                    existing_data = _loads(f.read())
                 
                 # Append new data
                 if key:
@@ -188,20 +344,20 @@ class JSONStorage:
                         logger.warning("Cannot append to non-collection at root level")
                 
                 # Save updated data
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
+                with open(filepath, 'wb') as f:
+                    _write_json(f, existing_data)
                     
                 logger.info(f"Data appended to {filepath}")
             else:
                 # File doesn't exist, create it
-                with open(filepath, 'w', encoding='utf-8') as f:
+                with open(filepath, 'wb') as f:
                     if key:
                         # Create a new structure with the key
                         root_data = {key: json_data}
-                        json.dump(root_data, f, indent=2, ensure_ascii=False)
+                        _write_json(f, root_data)
                     else:
                         # Just store the data directly
-                        json.dump(json_data, f, indent=2, ensure_ascii=False)
+                        _write_json(f, json_data)
                         
                 logger.info(f"File {filepath} created with data")
             
@@ -210,6 +366,70 @@ class JSONStorage:
             logger.error(f"Error appending data to {filepath}: {e}")
             raise
     
+    def append_ndjson(self, records: Any, filename: str) -> str:
+        """
+        Append records to a newline-delimited JSON file.
+        
+        Each record is written as one line at the end of the file, so the cost of an
+        append does not grow with the size of the file.
+        
+        Args:
+            records: Record or list of records to append (a DataFrame appends its rows)
+            filename: Name of the NDJSON file (with or without extension)
+            
+        Returns:
+            Path to the NDJSON file
+        """
+        if not filename.endswith(_NDJSON_EXTENSION):
+            filename += _NDJSON_EXTENSION
+            
+        filepath = os.path.join(self.output_dir, filename)
+        
+        try:
+            if isinstance(records, pd.DataFrame):
+                records = records.to_dict(orient='records')
+            elif not isinstance(records, (list, tuple)):
+                records = [records]
+            
+            with open(filepath, 'ab') as f:
+                f.write(b''.join(
+                    orjson.dumps(record, default=_json_default, option=_LINE_OPTIONS)
+                    for record in records
+                ))
+                
+            logger.info(f"{len(records)} records appended to {filepath}")
+            
+            return filepath
+        except Exception as e:
+            logger.error(f"Error appending data to {filepath}: {e}")
+            raise
+    
+    def load_ndjson(self, filename: str) -> List[Any]:
+        """
+        Load records from a newline-delimited JSON file.
+        
+        Args:
+            filename: Name of the NDJSON file (with or without extension)
+            
+        Returns:
+            List of records, one per non-empty line
+        """
+        if not filename.endswith(_NDJSON_EXTENSION):
+            filename += _NDJSON_EXTENSION
+            
+        filepath = os.path.join(self.output_dir, filename)
+        
+        try:
+            with open(filepath, 'rb') as f:
+                records = [orjson.loads(line) for line in f if line.strip()]
+                
+            logger.info(f"Data loaded from {filepath}")
+            
+            return records
+        except Exception as e:
+            logger.error(f"Error loading data from {filepath}: {e}")
+            raise
+    
     def list_files(self) -> List[str]:
         """
         List all JSON files in the output directory.
@@ -270,35 +490,3 @@ class JSONStorage:
         except Exception as e:
             logger.error(f"Error ensuring output directory {self.output_dir}: {e}")
             raise
-    
-    def _prepare_for_json(self, data: Any) -> Any:
-        """
-        Prepare data for JSON serialization.
-        
-        Args:
-            data: Data to prepare
-            
-        Returns:
-            JSON-serializable data
-        """
-        if isinstance(data, pd.DataFrame):
-            # Convert DataFrame to list of dictionaries
-            return data.to_dict(orient='records')
-        elif hasattr(data, 'to_dict'):
-            # Handle objects with to_dict method
-            return data.to_dict()
-        elif isinstance(data, (list, tuple)):
-            # Handle lists and tuples
-            return [self._prepare_for_json(item) for item in data]
-        elif isinstance(data, dict):
-            # Handle dictionaries
-            return {k: self._prepare_for_json(v) for k, v in data.items()}
-        elif isinstance(data, (int, float, str, bool, type(None))):
-            # Primitive types are already JSON-serializable
-            return data
-        elif hasattr(data, '__dict__'):
-            # Handle objects with __dict__ attribute
-            return self._prepare_for_json(data.__dict__)
-        else:
-            # Convert to string as a fallback
-            return str(data)
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Test module for the CoinTelegraph scraper.
+
+This module contains tests for the CoinTelegraph scraper functionality.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import requests
+from bs4 import BeautifulSoup
+
+from scrapers.cointelegraph import CoinTelegraphScraper
+
+
+def html_response(html):
+    """Build a fetched response holding the given HTML."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response.encoding = 'utf-8'
+    response._content = html.encode('utf-8')
+    return response
+
+
+class TestCoinTelegraphScraper(unittest.TestCase):
+    """Test cases for the CoinTelegraph scraper."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.scraper = CoinTelegraphScraper()
+
+    def test_parse_value(self):
+        """Test parsing values with different formats."""
+        # Test parsing regular numbers
+        self.assertEqual(self.scraper._parse_value('123'), 123)
+        self.assertEqual(self.scraper._parse_value('123.45'), 123.45)
+        self.assertEqual(self.scraper._parse_value(42), 42)
+
+        # Test parsing values with currency symbols and commas
+        self.assertEqual(self.scraper._parse_value('$1,234'), 1234)
+        self.assertEqual(self.scraper._parse_value('$1,234.56'), 1234.56)
+
+        # Test parsing values with suffixes
+        self.assertEqual(self.scraper._parse_value('1.2K'), 1200)
+        self.assertEqual(self.scraper._parse_value('$1.5M'), 1500000)
+        self.assertEqual(self.scraper._parse_value('2.5B'), 2500000000)
+
+        # Test parsing invalid values
+        self.assertIsNone(self.scraper._parse_value('—'))
+        self.assertIsNone(self.scraper._parse_value(''))
+        self.assertIsNone(self.scraper._parse_value(None))
+
+    def test_parse_percent(self):
+        """Test parsing percentage values."""
+        self.assertAlmostEqual(self.scraper._parse_percent('5%'), 0.05)
+        self.assertAlmostEqual(self.scraper._parse_percent('-2.5%'), -0.025)
+        self.assertIsNone(self.scraper._parse_percent('N/A'))
+        self.assertIsNone(self.scraper._parse_percent(None))
+
+    def test_extract_price_data_skips_malformed_script(self):
+        """Test that a state script failing partway is skipped instead of returning partial data."""
+        soup = BeautifulSoup("""
+            <script>window.__INITIAL_STATE__ = {"priceIndex": {"data": [
+                {"symbol": "btc", "price": {"value": "60000"}}, {"symbol": "eth", "price": "3000"}
+            ]}};</script>
+            <script>window.__INITIAL_STATE__ = {"priceIndex": {"data": [
+                {"symbol": "eth", "name": "Ethereum", "price": {"value": "3000"}}
+            ]}};</script>
+        """, 'lxml')
+
+        result = self.scraper._extract_price_data_from_script(soup)
+
+        self.assertEqual(list(result), ['ETH'])
+        self.assertEqual(result['ETH']['price'], 3000)
+
+    def test_extract_price_data_stops_at_state_without_price_index(self):
+        """Test that later scripts are not scanned once a state object without a price index parses."""
+        soup = BeautifulSoup("""
+            <script>window.__INITIAL_STATE__ = {"news": []};</script>
+            <script>window.__INITIAL_STATE__ = {"priceIndex": {"data": [{"symbol": "btc"}]}};</script>
+        """, 'lxml')
+
+        with self.assertLogs('scrapers.cointelegraph', level='WARNING'):
+            result = self.scraper._extract_price_data_from_script(soup)
+
+        self.assertEqual(result, {})
+
+    def test_extract_article_data(self):
+        """Test extracting article fields from an article element."""
+        html = """
+        <article class="post-card">
+            <span class="post-card__date">2 hours ago</span>
+            <h2 class="post-card__title"><a href="/news/bitcoin-rallies">Bitcoin rallies</a></h2>
+            <p class="post-card__excerpt">BTC climbs above resistance.</p>
+            <img data-src="https://images.cointelegraph.com/btc.png">
+            <a class="post-card__author-link">Jane Doe</a>
+            <ul class="post-card__tags"><li><a>Bitcoin</a></li><li><a>Markets</a></li></ul>
+        </article>
+        """
+        article = BeautifulSoup(html, 'lxml').article
+
+        result = self.scraper._extract_article_data(article)
+
+        self.assertEqual(result['headline'], 'Bitcoin rallies')
+        self.assertEqual(result['link'], 'https://cointelegraph.com/news/bitcoin-rallies')
+        self.assertEqual(result['timestamp'], '2 hours ago')
+        self.assertEqual(result['summary'], 'BTC climbs above resistance.')
+        self.assertEqual(result['image_url'], 'https://images.cointelegraph.com/btc.png')
+        self.assertEqual(result['author'], 'Jane Doe')
+        self.assertEqual(result['tags'], ['Bitcoin', 'Markets'])
+
+    def test_extract_article_data_without_headline(self):
+        """Test that elements without a headline are skipped."""
+        article = BeautifulSoup('<div class="post"><p>No title</p></div>', 'lxml').div
+        self.assertIsNone(self.scraper._extract_article_data(article))
+
+    @patch('scrapers.cointelegraph.CoinTelegraphScraper._make_request')
+    def test_scrape_crypto_news_multiple_tags_with_failing_tag(self, mock_request):
+        """Test that the multi-tag path merges parsed pages and records failing tags."""
+        def fetch(url):
+            if url.endswith('/ethereum'):
+                raise requests.RequestException("connection reset")
+            return html_response("""
+                <article class="post-card"><h2 class="post-card__title"><a href="/news/one">First story</a></h2></article>
+                <article class="post-card"><h2 class="post-card__title"><a href="/news/two">Second story</a></h2></article>
+            """)
+        mock_request.side_effect = fetch
+
+        result = self.scraper.scrape_crypto_news(tags=['bitcoin', 'ethereum'], max_articles=10)
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(
+            [article['headline'] for article in result['tags']['bitcoin']['articles']],
+            ['First story', 'Second story']
+        )
+        self.assertEqual(result['tags']['bitcoin']['articles'][0]['link'], 'https://cointelegraph.com/news/one')
+        self.assertEqual(result['tags']['ethereum'], {'error': 'connection reset'})
+
+
+if __name__ == '__main__':
+    unittest.main()
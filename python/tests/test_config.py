@@ -0,0 +1,166 @@
+"""
+Test module for the configuration manager.
+
+This module contains tests for loading and accessing configuration settings.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import filecache
+from utils.config import Config
+
+
+class TestConfig(unittest.TestCase):
+    """Test cases for the configuration manager."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, 'config.yaml')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write("storage:\n  type: csv\n  path: ./data\nsources:\n  cnbc:\n    enabled: true\n")
+
+        filecache.clear()
+
+    def tearDown(self):
+        """Clean up after the tests."""
+        filecache.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_yaml(self):
+        """Test loading nested values from a YAML file."""
+        config = Config(self.config_path)
+
+        self.assertEqual(config.get('storage.type'), 'csv')
+        self.assertTrue(config.get('sources.cnbc.enabled'))
+        self.assertEqual(config.get('sources.missing.enabled', 'default'), 'default')
+
+    def test_get_reflects_changes(self):
+        """Test that memoized lookups are refreshed after set and update."""
+        config = Config(self.config_path)
+        self.assertEqual(config.get('storage.type'), 'csv')
+        self.assertIsNone(config.get('storage.compress'))
+
+        config.set('storage.type', 'sqlite')
+        config.update({'storage': {'compress': True}})
+
+        self.assertEqual(config.get('storage.type'), 'sqlite')
+        self.assertTrue(config.get('storage.compress'))
+        self.assertEqual(config.get('storage')['path'], './data')
+
+    def test_get_compiled(self):
+        """Test lookups by a precompiled key path."""
+        config = Config(self.config_path)
+        key = Config.compile_key('sources.cnbc.enabled')
+
+        self.assertTrue(config.get_compiled(key))
+        config.set('sources.cnbc.enabled', False)
+        self.assertFalse(config.get_compiled(key))
+        self.assertEqual(config.get_compiled(Config.compile_key('sources.missing'), 'x'), 'x')
+
+    def test_update_merges_nested_and_replaces_flat(self):
+        """Test that update merges dictionaries on both sides and replaces everything else."""
+        config = Config(self.config_path)
+
+        config.update({'storage': {'type': 'json'}, 'sources': 'all', 'debug': True})
+
+        self.assertEqual(config.get('storage'), {'type': 'json', 'path': './data'})
+        self.assertEqual(config.get('sources'), 'all')
+        self.assertTrue(config.get('debug'))
+
+    def test_freeze(self):
+        """Test that a frozen configuration hands out read-only views and rejects changes."""
+        config = Config(self.config_path)
+        config.freeze()
+
+        storage = config.get('storage')
+        with self.assertRaises(TypeError):
+            storage['type'] = 'json'
+
+        config.set('storage.type', 'json')
+        config.update({'storage': {'path': './other'}})
+
+        self.assertTrue(config.frozen)
+        self.assertEqual(config.get('storage.type'), 'csv')
+        self.assertEqual(config.get_all()['storage']['path'], './data')
+
+    def test_env_override_after_refresh(self):
+        """Test that TRADINGAPP_ variables apply once the environment is re-read."""
+        with patch.dict(os.environ, {'TRADINGAPP_STORAGE_TYPE': 'json'}):
+            Config.refresh_env()
+            config = Config(self.config_path)
+        Config.refresh_env()
+
+        self.assertEqual(config.get('storage.type'), 'json')
+        self.assertEqual(Config(self.config_path).get('storage.type'), 'csv')
+
+    def test_load_env_disabled(self):
+        """Test that environment overrides are skipped when load_env is False."""
+        with patch.dict(os.environ, {'TRADINGAPP_STORAGE_TYPE': 'json'}):
+            Config.refresh_env()
+            config = Config(self.config_path, load_env=False)
+        Config.refresh_env()
+
+        self.assertEqual(config.get('storage.type'), 'csv')
+
+    def test_cached_load_is_independent_copy(self):
+        """Test that a cached load is not affected by changes to an earlier instance."""
+        first = Config(self.config_path)
+        first.set('storage.type', 'sqlite')
+
+        second = Config(self.config_path)
+
+        self.assertEqual(second.get('storage.type'), 'csv')
+
+    def test_cache_invalidated_when_file_changes(self):
+        """Test that an edited file is parsed again."""
+        Config(self.config_path)
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write("storage:\n  type: json\n")
+
+        self.assertEqual(Config(self.config_path).get('storage.type'), 'json')
+
+    def test_unchanged_file_not_parsed_again(self):
+        """Test that an unchanged file is served from the cache."""
+        Config(self.config_path)
+
+        with patch('yaml.load') as mock_load:
+            config = Config(self.config_path)
+
+        mock_load.assert_not_called()
+        self.assertEqual(config.get('storage.path'), './data')
+
+    def test_clear_cache(self):
+        """Test that clear_cache forces the next load to parse the file again."""
+        Config(self.config_path)
+        Config.clear_cache()
+
+        with patch('yaml.load', return_value={'storage': {'type': 'json'}}) as mock_load:
+            config = Config(self.config_path)
+
+        mock_load.assert_called_once()
+        self.assertEqual(config.get('storage.type'), 'json')
+
+    def test_save_config_bare_file_name(self):
+        """Test saving to a path without a directory component."""
+        config = Config(self.config_path)
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            self.assertTrue(config.save_config('saved.json'))
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(Config(os.path.join(self.temp_dir, 'saved.json')).get('storage.type'), 'csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
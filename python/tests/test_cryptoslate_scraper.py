@@ -0,0 +1,182 @@
+"""
+Test module for the CryptoSlate scraper.
+
+This module contains tests for the CryptoSlate scraper functionality.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lxml.html
+import requests
+from bs4 import BeautifulSoup
+
+from scrapers.cryptoslate import CryptoSlateScraper
+
+MARKETS_HTML = """
+<html><body>
+<div class="market-stat">Total Market Cap $2,345,678,901</div>
+<div class="stat-volume">Total Volume $98,765</div>
+<div class="metric">Cryptocurrencies 12,345</div>
+<table>
+    <tr><th>#</th><th>Name</th><th>Symbol</th><th>Price</th><th>24h Change</th><th>Volume 24h</th><th>Market Cap</th></tr>
+    <tr><td>1</td><td>Bitcoin</td><td>BTC</td><td>$60,123.45</td><td>+2.5%</td><td>$35.2B</td><td>$1.18T</td></tr>
+    <tr><td>2</td><td>Ethereum</td><td>ETH</td><td>$3,000.10</td><td>-1.2%</td><td>$15B</td><td>$360B</td></tr>
+    <tr><td>footer</td></tr>
+</table>
+</body></html>
+"""
+
+ARTICLE_HTML = """
+<article class="post">
+    <h2 class="entry-title"><a href="/bitcoin-hits-high">Bitcoin hits a new high</a></h2>
+    <time datetime="2024-01-01T00:00:00Z">Jan 1</time>
+    <span class="author-name">Alice</span>
+    <p class="excerpt">Short summary of the article.</p>
+    <a class="tag-link">Bitcoin</a>
+    <a class="category">Markets</a>
+</article>
+"""
+
+
+def html_response(html):
+    """Build a fetched response holding the given HTML."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response.encoding = 'utf-8'
+    response._content = html.encode('utf-8')
+    return response
+
+
+class TestCryptoSlateScraper(unittest.TestCase):
+    """Test cases for the CryptoSlate scraper."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.scraper = CryptoSlateScraper()
+        self.markets_tree = lxml.html.document_fromstring(MARKETS_HTML)
+
+    def test_extract_article_data(self):
+        """Test extracting article fields from an lxml-parsed article."""
+        article = BeautifulSoup(ARTICLE_HTML, 'lxml').article
+
+        result = self.scraper._extract_article_data(article)
+
+        self.assertEqual(result['title'], 'Bitcoin hits a new high')
+        self.assertEqual(result['link'], 'https://cryptoslate.com/bitcoin-hits-high')
+        self.assertEqual(result['date'], '2024-01-01T00:00:00Z')
+        self.assertEqual(result['author'], 'Alice')
+        self.assertEqual(result['summary'], 'Short summary of the article.')
+        self.assertEqual(result['tags'], ['Bitcoin', 'Markets'])
+
+    @patch('scrapers.cryptoslate.CryptoSlateScraper._make_request')
+    def test_scrape_crypto_news_bare_articles(self, mock_request):
+        """Test that unclassed <article> tags survive the strainer, with one request per page."""
+        mock_request.return_value = html_response("""
+            <nav class="news-menu"><h3>Menu</h3></nav>
+            <article><div class="post-meta">Jan 1</div><h2><a href="/one">First story</a></h2></article>
+            <article><h2><a href="/two">Second story</a></h2></article>
+        """)
+
+        result = self.scraper.scrape_crypto_news(max_articles=5)
+
+        self.assertEqual([a['title'] for a in result['articles']], ['First story', 'Second story'])
+        mock_request.assert_called_once_with(CryptoSlateScraper.NEWS_URL)
+
+    @patch('scrapers.cryptoslate.CryptoSlateScraper._make_request')
+    def test_scrape_crypto_news_div_fallback(self, mock_request):
+        """Test that news-like divs are used when no article container matches."""
+        mock_request.return_value = html_response("""
+            <div class="latest-news"><h3><a href="/one">First story</a></h3></div>
+            <div class="sidebar"><h3>Not an article</h3></div>
+            <div class="news-card"><h3><a href="/two">Second story</a></h3></div>
+        """)
+
+        result = self.scraper.scrape_crypto_news(max_articles=5)
+
+        self.assertEqual([a['title'] for a in result['articles']], ['First story', 'Second story'])
+        self.assertEqual(result['total_count'], 2)
+        mock_request.assert_called_once()
+
+    def test_find_article_elements_prefers_article_tags(self):
+        """Test that a .post-item nested in an <article> is not returned as a second article."""
+        soup = BeautifulSoup("""
+            <article><div class="post-item"><h2><a href="/one">First story</a></h2></div></article>
+            <article><h2><a href="/two">Second story</a></h2></article>
+        """, 'lxml')
+
+        elements = self.scraper._find_article_elements(soup)
+
+        self.assertEqual([element.name for element in elements], ['article', 'article'])
+
+    def test_parse_crypto_table(self):
+        """Test parsing the markets table."""
+        result = self.scraper._parse_crypto_table(self.markets_tree.find('.//table'))
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0], {
+            'name': 'Bitcoin',
+            'symbol': 'BTC',
+            'price': 60123.45,
+            'change_24h': 2.5,
+            'volume_24h': 35_200_000_000,
+            'market_cap': 1_180_000_000_000,
+            'source': 'CryptoSlate'
+        })
+        self.assertEqual(result[1]['symbol'], 'ETH')
+        self.assertEqual(result[1]['change_24h'], -1.2)
+
+    def test_parse_crypto_table_nested_cells(self):
+        """Test that text split across tags in a cell reads as it does with BeautifulSoup."""
+        table = lxml.html.fragment_fromstring("""
+            <table>
+                <tr><th>Name</th><th>24h Change</th></tr>
+                <tr><td> <span>Bitcoin</span>\n<small>BTC</small> </td><td><span>-1.2</span>\n<span>%</span></td></tr>
+            </table>
+        """)
+
+        result = self.scraper._parse_crypto_table(table)
+
+        self.assertEqual(result, [{'name': 'BitcoinBTC', 'change_24h': -1.2, 'source': 'CryptoSlate'}])
+
+    def test_extract_market_stats(self):
+        """Test extracting the market statistics."""
+        result = self.scraper._extract_market_stats(self.markets_tree)
+
+        self.assertEqual(result['total_market_cap'], 2345678901)
+        self.assertEqual(result['total_volume'], 98765)
+        self.assertEqual(result['active_cryptocurrencies'], 12345)
+
+    def test_extract_market_stats_label_priority(self):
+        """Test that a stat naming several labels is classified by priority, not position."""
+        tree = lxml.html.document_fromstring(
+            '<div class="stat">Coins: 10,000 | Total Market Cap: $1,234,567</div>'
+        )
+
+        result = self.scraper._extract_market_stats(tree)
+
+        self.assertEqual(result, {'total_market_cap': 1234567})
+
+    def test_parse_helpers(self):
+        """Test parsing prices, percentages and suffixed numbers."""
+        self.assertEqual(self.scraper._parse_price('$1,234.56'), 1234.56)
+        self.assertEqual(self.scraper._parse_price('N/A'), 0.0)
+
+        self.assertEqual(self.scraper._parse_percentage('+2.5%'), 2.5)
+        self.assertEqual(self.scraper._parse_percentage('-1.25%'), -1.25)
+        self.assertEqual(self.scraper._parse_percentage('--'), 0.0)
+
+        self.assertEqual(self.scraper._parse_number('1,234'), 1234)
+        self.assertEqual(self.scraper._parse_number('$1.2B'), 1_200_000_000)
+        self.assertEqual(self.scraper._parse_number('3.4m'), 3_400_000)
+        self.assertEqual(self.scraper._parse_number('n/a'), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Test module for the data visualizer.
+
+This module contains tests for the data visualizer functionality.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from visualization.data_visualizer import (
+    DataVisualizer, _binned_kde, _lttb_indices, _lttb_select_numpy, _lttb_select_scalar
+)
+
+
+class TestDataVisualizer(unittest.TestCase):
+    """Test cases for the data visualizer."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.visualizer = DataVisualizer(self.temp_dir)
+        self.data = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=30, freq='D'),
+            'price': np.linspace(100.0, 130.0, 30),
+            'symbol': [f"S{i}" for i in range(30)]
+        })
+
+    def tearDown(self):
+        """Clean up after the tests."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_plot_time_series_saves_without_pyplot_registry(self):
+        """Test that plotted figures are saved and not kept in pyplot's registry."""
+        fig = self.visualizer.plot_time_series(self.data, 'date', 'price', save_path='prices.png')
+
+        self.assertEqual(len(fig.axes), 1)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'prices.png')))
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_interactive_figures_use_pyplot(self):
+        """Test that an interactive visualizer creates figures pyplot can show."""
+        visualizer = DataVisualizer(self.temp_dir, interactive=True)
+
+        fig = visualizer.plot_time_series(self.data, 'date', 'price')
+
+        try:
+            self.assertEqual(plt.get_fignums(), [fig.number])
+        finally:
+            plt.close(fig)
+
+    def test_plot_error_returns_unregistered_figure(self):
+        """Test that a failed plot returns an empty figure without leaking it into pyplot."""
+        fig = self.visualizer.plot_time_series(self.data, 'missing', 'price')
+
+        self.assertEqual(fig.axes, [])
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_interactive_plot_error_closes_partial_figure(self):
+        """Test that a failed interactive plot does not leave its partly built figure open."""
+        visualizer = DataVisualizer(self.temp_dir, interactive=True)
+
+        time_series = visualizer.plot_time_series(self.data, 'date', 'missing')
+        bar = visualizer.plot_bar(self.data, 'symbol', 'price', color=object())
+
+        self.assertEqual(time_series.axes, [])
+        self.assertEqual(bar.axes, [])
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_save_many(self):
+        """Test saving several figures at once."""
+        figures = [
+            (self.visualizer.plot_time_series(self.data, 'date', 'price', figsize=(4, 3)), f"chart_{i}")
+            for i in range(3)
+        ]
+
+        paths = self.visualizer.save_many(figures, dpi=50)
+
+        self.assertEqual(paths, [os.path.join(self.temp_dir, f"chart_{i}.png") for i in range(3)])
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def test_update_time_series(self):
+        """Test replacing the data of an existing time series chart."""
+        fig = self.visualizer.plot_time_series(self.data, 'date', 'price')
+        updated = self.data.assign(price=self.data['price'] * 10)
+
+        self.visualizer.update_time_series(fig, updated, 'date', 'price')
+
+        line = fig.axes[0].lines[0]
+        self.assertEqual(list(line.get_ydata()), list(updated['price']))
+        self.assertGreaterEqual(fig.axes[0].get_ylim()[1], 1300.0)
+
+    def test_update_time_series_downsamples_like_plot(self):
+        """Test that updating a chart picks the same points as plotting it afresh."""
+        n = 20_000
+        data = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=n, freq='min'),
+            'price': np.random.default_rng(0).normal(size=n).cumsum()
+        })
+        fig = self.visualizer.plot_time_series(self.data, 'date', 'price')
+
+        self.visualizer.update_time_series(fig, data, 'date', 'price', max_points=500)
+
+        fresh = self.visualizer.plot_time_series(data, 'date', 'price', max_points=500)
+        self.assertEqual(list(fig.axes[0].lines[0].get_ydata()), list(fresh.axes[0].lines[0].get_ydata()))
+        self.assertEqual(len(fig.axes[0].lines[0].get_ydata()), 500)
+
+    def test_plot_bar_skips_non_numeric_values(self):
+        """Test that bars are only drawn for numeric values."""
+        data = pd.DataFrame({'symbol': ['BTC', 'ETH', 'XRP'], 'price': ['60000', 'n/a', '0.5']})
+
+        fig = self.visualizer.plot_bar(data, 'symbol', 'price')
+
+        heights = [patch.get_height() for patch in fig.axes[0].patches]
+        self.assertEqual(heights, [60000.0, 0.5])
+
+    def test_plot_comparison_labels_and_colors(self):
+        """Test that each compared series gets its own labelled line."""
+        data = self.data.assign(volume=np.arange(30.0))
+
+        fig = self.visualizer.plot_comparison(data, 'date', ['price', 'volume'], colors=['red'])
+
+        lines = fig.axes[0].lines
+        self.assertEqual([line.get_label() for line in lines], ['price', 'volume'])
+        self.assertEqual(lines[0].get_color(), 'red')
+        self.assertEqual(list(lines[1].get_ydata()), list(data['volume']))
+
+    def test_plot_heatmap_annotates_small_matrices_only(self):
+        """Test that heatmap cells are annotated only below the size limit."""
+        small = pd.DataFrame(np.eye(3), columns=list('abc'), index=list('abc'))
+        large = pd.DataFrame(np.zeros((20, 20)))
+
+        small_ax = self.visualizer.plot_heatmap(small).axes[0]
+        large_ax = self.visualizer.plot_heatmap(large).axes[0]
+
+        self.assertEqual([text.get_text() for text in small_ax.texts][:3], ['1', '0', '0'])
+        self.assertEqual([label.get_text() for label in small_ax.get_xticklabels()], ['a', 'b', 'c'])
+        self.assertEqual(len(large_ax.texts), 0)
+
+    def test_binned_kde(self):
+        """Test that the binned density estimate integrates to one and peaks at the mode."""
+        values = np.random.default_rng(0).normal(5.0, 1.0, 50_000)
+
+        grid, density, n = _binned_kde(values)
+
+        self.assertEqual(n, 50_000)
+        self.assertAlmostEqual(np.trapezoid(density, grid), 1.0, places=3)
+        self.assertAlmostEqual(grid[np.argmax(density)], 5.0, delta=0.2)
+        self.assertIsNone(_binned_kde(np.array([1.0, 1.0, 1.0])))
+
+    def test_plot_time_series_downsamples_long_series(self):
+        """Test that long series are reduced with LTTB while keeping extremes."""
+        n = 20_000
+        prices = np.sin(np.linspace(0, 20, n))
+        prices[12_345] = 50.0
+        data = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=n, freq='min'), 'price': prices})
+
+        fig = self.visualizer.plot_time_series(data, 'date', 'price', max_points=500)
+
+        ydata = fig.axes[0].lines[0].get_ydata()
+        self.assertEqual(len(ydata), 500)
+        self.assertEqual(max(ydata), 50.0)
+        self.assertEqual(ydata[0], prices[0])
+        self.assertEqual(ydata[-1], prices[-1])
+
+    def test_lttb_kernels_agree(self):
+        """Test that the loop kernel compiled with numba picks the same points as the NumPy one."""
+        rng = np.random.default_rng(1)
+        x = np.arange(10_000, dtype=float)
+        y = rng.normal(size=10_000).cumsum()
+        y[rng.integers(0, 10_000, 50)] = np.nan
+
+        with patch('visualization.data_visualizer._lttb_select', _lttb_select_numpy):
+            expected = _lttb_indices(x, y, 300)
+        with patch('visualization.data_visualizer._lttb_select', _lttb_select_scalar):
+            actual = _lttb_indices(x, y, 300)
+
+        np.testing.assert_array_equal(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Test module for the JSON storage.
+
+This module contains tests for the JSON storage functionality.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add the parent directory to the path so we can import the application modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pandas as pd
+
+from storage.json_storage import JSONStorage
+
+
+class TestJSONStorage(unittest.TestCase):
+    """Test cases for the JSON storage."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.output_dir = tempfile.mkdtemp()
+        self.storage = JSONStorage(self.output_dir)
+
+    def tearDown(self):
+        """Clean up after the tests."""
+        shutil.rmtree(self.output_dir)
+
+    def test_store_and_load(self):
+        """Test round-tripping nested data including a DataFrame."""
+        data = {'prices': pd.DataFrame({'symbol': ['BTC', 'ETH'], 'price': [60000.5, 3000.0]}), 1: 'one'}
+
+        path = self.storage.store(data, 'prices')
+
+        self.assertTrue(path.endswith('prices.json'))
+        self.assertEqual(self.storage.load('prices'), {
+            'prices': [{'symbol': 'BTC', 'price': 60000.5}, {'symbol': 'ETH', 'price': 3000.0}],
+            '1': 'one'
+        })
+
+    def test_append_extends_list(self):
+        """Test appending records to a JSON list file."""
+        self.storage.append([{'id': 1}], 'articles')
+        self.storage.append({'id': 2}, 'articles')
+
+        self.assertEqual(self.storage.load('articles'), [{'id': 1}, {'id': 2}])
+
+    def test_append_to_empty_list_and_dict(self):
+        """Test appending to an empty list file and to a dict-rooted file."""
+        self.storage.store([], 'empty')
+        self.storage.append([{'id': 1}, {'id': 2}], 'empty')
+        self.storage.store({'BTC': 1}, 'prices')
+        self.storage.append({'ETH': 2}, 'prices')
+
+        self.assertEqual(self.storage.load('empty'), [{'id': 1}, {'id': 2}])
+        self.assertEqual(self.storage.load('prices'), {'BTC': 1, 'ETH': 2})
+
+    def test_append_ndjson(self):
+        """Test that .ndjson files are appended line by line."""
+        self.storage.append([{'id': 1}, {'id': 2}], 'articles.ndjson')
+        self.storage.append_ndjson({'id': 3, 'title': 'Ünïcode'}, 'articles')
+
+        with open(os.path.join(self.output_dir, 'articles.ndjson'), 'rb') as f:
+            self.assertEqual(len(f.readlines()), 3)
+        self.assertEqual(self.storage.load_ndjson('articles'), [
+            {'id': 1}, {'id': 2}, {'id': 3, 'title': 'Ünïcode'}
+        ])
+
+    def test_datetime_and_nan_values(self):
+        """Test that datetimes are stored as str() and NaN/infinity as null."""
+        data = {'scraped_at': datetime(2024, 1, 2, 3, 4, 5), 'change': float('nan'), 'cap': float('inf')}
+
+        self.storage.store(data, 'quote')
+
+        self.assertEqual(self.storage.load('quote'), {
+            'scraped_at': '2024-01-02 03:04:05', 'change': None, 'cap': None
+        })
+
+    def test_load_json_module_nan(self):
+        """Test loading a file with bare NaN tokens, as written by the json module."""
+        with open(os.path.join(self.output_dir, 'legacy.json'), 'w', encoding='utf-8') as f:
+            f.write('{"change": NaN, "price": 1.5}')
+
+        result = self.storage.load('legacy')
+
+        self.assertNotEqual(result['change'], result['change'])
+        self.assertEqual(result['price'], 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
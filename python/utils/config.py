@@ -4,15 +4,194 @@ Configuration module for the Trading Information Scraper application.
 This module provides functionality for loading and managing configuration settings.
 """
 
-import json
+import copy
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-import yaml
+import orjson
+
+from . import filecache
 
 logger = logging.getLogger(__name__)
 
+# Set to a true value to keep a pre-parsed <config>.yaml.json next to YAML configs
+_JSON_SIDECAR_ENV = 'TRADINGAPP_CONFIG_JSON_CACHE'
+
+_JSON_SAVE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Marks a key that is not present in the configuration
+_MISSING = object()
+
+# Environment value classification for _parse_env_value
+_ENV_TRUE = frozenset({'true', 'yes', '1'})
+_ENV_FALSE = frozenset({'false', 'no', '0'})
+_ENV_INT_RE = re.compile(r'[+-]?\d+')
+_ENV_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Environment as of import (plus values loaded from .env); see Config.refresh_env()
+_ENV_SNAPSHOT: Dict[str, str] = dict(os.environ)
+
+# .env file at the project root, and the modification time it was last loaded at
+_ENV_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env"))
+_ENV_FILES_LOADED: Dict[str, int] = {}
+_ENV_FILE_LOCK = threading.Lock()
+
+# KEY=value line of a .env file; comment lines and lines without '=' do not match
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=(.*)$', re.MULTILINE)
+
+# Directories save_config has already created or found, so they are not checked again
+_ENSURED_DIRS = set()
+
+# Configuration written by Config.create_default_config; copied, never modified
+_DEFAULT_CONFIG_TEMPLATE = {
+    'sources': {
+        'yahoo_finance': {
+            'enabled': True,
+            'symbols': ['AAPL', 'MSFT', 'GOOGL', 'AMZN'],
+            'data_points': ['price', 'volume', 'market_cap', 'pe_ratio'],
+            'max_workers': 8
+        },
+        'cnbc': {
+            'enabled': True,
+            'categories': ['markets', 'business', 'investing'],
+            'max_articles': 50
+        },
+        'cointelegraph': {
+            'enabled': True,
+            'cryptocurrencies': ['BTC', 'ETH', 'XRP', 'ADA'],
+            'include_news': True
+        }
+    },
+    'storage': {
+        'type': 'csv',  # 'csv', 'sqlite', or 'json'
+        'path': './data'
+    },
+    'scheduling': {
+        'frequency': 'once',  # 'once', 'hourly', 'daily'
+        'time': '09:00'  # For 'daily' frequency
+    },
+    'logging': {
+        'level': 'INFO',  # 'DEBUG', 'INFO', 'WARNING', 'ERROR'
+        'file': './logs/app.log'
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, type, type]:
+    """
+    Import PyYAML on first use, so JSON-only setups never load it.
+    
+    Returns:
+        Tuple of the yaml module, its safe loader class and its safe dumper class
+    """
+    import yaml
+    
+    try:
+        # libyaml C bindings parse several times faster than the pure-Python loader
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeDumper as dumper, SafeLoader as loader
+    
+    return yaml, loader, dumper
+
+
+def _load_yaml(config_path: str) -> Any:
+    """
+    Parse a YAML configuration file, optionally through a JSON sidecar.
+
+    When TRADINGAPP_CONFIG_JSON_CACHE is set, the parsed YAML is also written to
+    <config_path>.json, and later loads read that file instead as long as it is not
+    older than the YAML file. JSON has a much simpler grammar than YAML and is
+    parsed by orjson.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Parsed configuration
+    """
+    use_sidecar = Config._parse_env_value(_ENV_SNAPSHOT.get(_JSON_SIDECAR_ENV, 'false')) is True
+    sidecar_path = config_path + '.json'
+
+    if use_sidecar:
+        try:
+            if os.stat(sidecar_path).st_mtime_ns >= os.stat(config_path).st_mtime_ns:
+                return orjson.loads(Path(sidecar_path).read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config sidecar {sidecar_path}: {e}")
+
+    # Parsers take the raw bytes and detect the encoding, so no decoded copy is made
+    yaml, loader, _ = _yaml()
+    config = yaml.load(Path(config_path).read_bytes(), Loader=loader)
+
+    if use_sidecar:
+        try:
+            _write_atomic(sidecar_path, orjson.dumps(config, default=str, option=orjson.OPT_NON_STR_KEYS))
+        except Exception as e:
+            logger.warning(f"Could not write config sidecar {sidecar_path}: {e}")
+
+    return config
+
+
+def _load_json(config_path: str) -> Any:
+    """Parse a JSON configuration file."""
+    return orjson.loads(Path(config_path).read_bytes())
+
+
+def _dump_yaml(config: Dict) -> bytes:
+    """Serialize a configuration as UTF-8 YAML, keeping key order and non-ASCII text readable."""
+    yaml, _, dumper = _yaml()
+    return yaml.dump(
+        config, Dumper=dumper, encoding='utf-8',
+        default_flow_style=False, sort_keys=False, allow_unicode=True
+    )
+
+
+def _dump_json(config: Dict) -> bytes:
+    """Serialize a configuration as indented JSON."""
+    return orjson.dumps(config, option=_JSON_SAVE_OPTIONS)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace a file's contents in one step.
+    
+    The data is written to a temporary file next to the target, which is then renamed
+    over it, so readers and crashes never leave a partially written file behind.
+    
+    Args:
+        path: File to write
+        data: New contents
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Configuration file extension -> (loader, serializer)
+_FORMATS: Dict[str, Tuple[Callable[[str], Any], Callable[[Dict], bytes]]] = {
+    '.yaml': (_load_yaml, _dump_yaml),
+    '.yml': (_load_yaml, _dump_yaml),
+    '.json': (_load_json, _dump_json),
+}
+
 
 class Config:
     """
@@ -22,25 +201,41 @@ class Config:
     from various sources (YAML, JSON, environment variables).
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    __slots__ = ('config_path', 'config', '_get_cache', '_split_cache', '_flat', '_frozen')
+    
+    def __init__(self, config_path: Optional[str] = None, load_env: bool = True):
         """
         Initialize the configuration manager.
         
         Args:
             config_path: Path to the configuration file (YAML or JSON)
+            load_env: Apply TRADINGAPP_ variables, the project .env file and
+                OPENROUTER_API_KEY on top of the file. Pass False for scripts and tests
+                that only need the file contents.
         """
         self.config_path = config_path
         self.config = {}
         
+        # Resolved values and split keys for get(); values are dropped on every change
+        self._get_cache: Dict[str, Any] = {}
+        self._split_cache: Dict[str, Tuple[str, ...]] = {}
+        # Every nested value indexed by its key path; rebuilt lazily after a change
+        self._flat: Optional[Dict[Tuple[str, ...], Any]] = None
+        # Read-only view of the configuration, set by freeze()
+        self._frozen: Optional[Mapping[str, Any]] = None
+        
         if config_path:
             self.load_config(config_path)
 
+        if not load_env:
+            return
+
         # Load environment variables
         self._load_env_vars()
 
         # After loading file + env, resolve llm.openrouter.api_key from OPENROUTER_API_KEY if present
         try:
-            env_key = os.environ.get("OPENROUTER_API_KEY")
+            env_key = _ENV_SNAPSHOT.get("OPENROUTER_API_KEY")
             if env_key:
                 # Ensure nested structure exists and set key (kept in-memory; do not persist automatically)
                 if hasattr(self, "ensure_path"):
@@ -60,27 +255,33 @@ class Config:
             True if successful, False otherwise
         """
         try:
+            self._check_mutable()
             self.config_path = config_path
+            self._invalidate()
             
-            if not os.path.exists(config_path):
-                logger.warning(f"Configuration file not found: {config_path}")
-                return False
-                
             # Determine file type based on extension
-            _, ext = os.path.splitext(config_path)
-            
-            if ext.lower() in ['.yaml', '.yml']:
-                with open(config_path, 'r') as f:
-                    self.config = yaml.safe_load(f)
-            elif ext.lower() == '.json':
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
-            else:
+            ext = os.path.splitext(config_path)[1].lower()
+            formats = _FORMATS.get(ext)
+            if formats is None:
                 logger.warning(f"Unsupported configuration file format: {ext}")
                 return False
+            
+            # Reuse the parsed contents if the file is unchanged since it was last parsed
+            cached = filecache.get(config_path)
+            if cached is not None:
+                self.config = cached
+                logger.info(f"Configuration loaded from {config_path} (cached)")
+                return True
+            
+            # Open directly instead of checking existence first; a missing file surfaces here
+            self.config = formats[0](config_path)
+            filecache.put(config_path, self.config)
                 
             logger.info(f"Configuration loaded from {config_path}")
             return True
+        except FileNotFoundError:
+            logger.warning(f"Configuration file not found: {config_path}")
+            return False
         except Exception as e:
             logger.error(f"Error loading configuration from {config_path}: {e}")
             return False
@@ -93,14 +294,11 @@ class Config:
             key: Configuration key in dot notation, e.g., 'llm.openrouter.api_key'
         """
         try:
+            self._check_mutable()
             if not key:
                 return
-            parts = key.split(".")
-            cfg = self.config
-            for part in parts[:-1]:
-                if part not in cfg or not isinstance(cfg.get(part), dict):
-                    cfg[part] = {}
-                cfg = cfg[part]
+            self._parent_dict(self.config, key.split("."))
+            self._invalidate()
         except Exception as e:
             logger.error(f"Error ensuring configuration path for {key}: {e}")
 
@@ -138,22 +336,20 @@ class Config:
                 logger.warning("No configuration path specified")
                 return False
                 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
+            # Create directory if it doesn't exist; a bare file name is saved to the cwd
+            config_dir = os.path.dirname(config_path)
+            if config_dir and config_dir not in _ENSURED_DIRS:
+                os.makedirs(config_dir, exist_ok=True)
+                _ENSURED_DIRS.add(config_dir)
                 
             # Determine file type based on extension
-            _, ext = os.path.splitext(config_path)
-
-            # Always write YAML safely preserving readability
-            if ext.lower() in ['.yaml', '.yml']:
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    yaml.safe_dump(self.config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-            elif ext.lower() == '.json':
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.config, f, indent=2, ensure_ascii=False)
-            else:
+            ext = os.path.splitext(config_path)[1].lower()
+            formats = _FORMATS.get(ext)
+            if formats is None:
                 logger.warning(f"Unsupported configuration file format: {ext}")
                 return False
+            
+            _write_atomic(config_path, formats[1](self.config))
                 
             logger.info(f"Configuration saved to {config_path}")
             return True
@@ -165,6 +361,10 @@ class Config:
         """
         Get a configuration value.
         
+        Resolved values are memoized per key until the configuration is changed through
+        this class (set, update, load_config, ...). Changes made directly to the dict
+        returned by get_all() are not seen by memoized keys.
+        
         Args:
             key: Configuration key (can use dot notation for nested keys)
             default: Default value if the key is not found
@@ -173,24 +373,142 @@ class Config:
             Configuration value or default
         """
         try:
-            # Handle nested keys with dot notation
-            if '.' in key:
-                parts = key.split('.')
-                value = self.config
-                
-                for part in parts:
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        return default
-                        
-                return value
-            else:
-                return self.config.get(key, default)
+            value = self._get_cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._get_cache[key] = self._resolve(key)
+            
+            return default if value is _MISSING else value
         except Exception as e:
             logger.debug(f"Error getting configuration value for {key}: {e}")
             return default
     
+    def _resolve(self, key: str) -> Any:
+        """
+        Look up a configuration value in the flat key-path index.
+        
+        Args:
+            key: Configuration key (can use dot notation for nested keys)
+            
+        Returns:
+            Configuration value, or _MISSING if the key is not found
+        """
+        parts = self._split_cache.get(key)
+        if parts is None:
+            parts = self._split_cache[key] = self.compile_key(key)
+        
+        return self.get_compiled(parts, _MISSING)
+    
+    @staticmethod
+    def compile_key(key: str) -> Tuple[str, ...]:
+        """
+        Split a dot-notation key once, for repeated lookups with get_compiled().
+        
+        Args:
+            key: Configuration key in dot notation, e.g. 'sources.yahoo_finance.symbols'
+            
+        Returns:
+            Key path tuple
+        """
+        return tuple(key.split('.'))
+    
+    def get_compiled(self, parts: Tuple[str, ...], default: Any = None) -> Any:
+        """
+        Get a configuration value by a key path from compile_key().
+        
+        Meant for hot loops: the path is looked up directly in the flat key-path index,
+        without handling the dotted string on each call.
+        
+        Args:
+            parts: Key path tuple returned by compile_key()
+            default: Default value if the key is not found
+            
+        Returns:
+            Configuration value or default
+        """
+        if self._flat is None:
+            self._flat = self._build_flat_index(self.config if self._frozen is None else self._frozen)
+        
+        value = self._flat.get(parts, _MISSING)
+        return default if value is _MISSING else value
+    
+    @staticmethod
+    def _build_flat_index(config: Any) -> Dict[Tuple[str, ...], Any]:
+        """
+        Index every value of a nested configuration by its key path.
+        
+        Both leaves and intermediate dictionaries are indexed, so a lookup of any
+        depth is a single dict access.
+        
+        Args:
+            config: Nested configuration dictionary
+            
+        Returns:
+            Dictionary mapping key-path tuples to values
+        """
+        flat = {}
+        if not isinstance(config, (dict, MappingProxyType)):
+            return flat
+        
+        stack = [((), config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = prefix + (key,)
+                flat[path] = value
+                if isinstance(value, (dict, MappingProxyType)):
+                    stack.append((path, value))
+        
+        return flat
+    
+    def _invalidate(self) -> None:
+        """Drop memoized get() results and the key-path index after a change."""
+        self._get_cache.clear()
+        self._flat = None
+    
+    def freeze(self) -> Mapping[str, Any]:
+        """
+        Make the configuration read-only.
+        
+        Once startup is done the configuration can be frozen so that get() and
+        get_all() hand out read-only views of nested sections, which can be shared
+        between threads without copying. Afterwards set(), update(), ensure_path()
+        and load_config() log an error and leave the configuration unchanged.
+        Lists inside the configuration are not copied and remain mutable.
+        
+        Returns:
+            Read-only view of the configuration
+        """
+        if self._frozen is None:
+            self._frozen = self._freeze_dict(self.config)
+            self._invalidate()
+        return self._frozen
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self._frozen is not None
+    
+    @staticmethod
+    def _freeze_dict(config: Dict) -> Mapping[str, Any]:
+        """
+        Wrap a nested dictionary, and every dictionary inside it, in read-only views.
+        
+        Args:
+            config: Nested configuration dictionary
+            
+        Returns:
+            Read-only view of the dictionary
+        """
+        return MappingProxyType({
+            key: Config._freeze_dict(value) if isinstance(value, dict) else value
+            for key, value in config.items()
+        })
+    
+    def _check_mutable(self) -> None:
+        """Raise TypeError if the configuration has been frozen."""
+        if self._frozen is not None:
+            raise TypeError("configuration is frozen")
+    
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value.
@@ -200,35 +518,22 @@ class Config:
             value: Value to set
         """
         try:
+            self._check_mutable()
             # Handle nested keys with dot notation
-            if '.' in key:
-                parts = key.split('.')
-                config = self.config
-                
-                # Navigate to the nested dictionary
-                for part in parts[:-1]:
-                    if part not in config:
-                        config[part] = {}
-                    elif not isinstance(config[part], dict):
-                        config[part] = {}
-                        
-                    config = config[part]
-                    
-                # Set the value in the nested dictionary
-                config[parts[-1]] = value
-            else:
-                self.config[key] = value
+            parts = key.split('.')
+            self._parent_dict(self.config, parts)[parts[-1]] = value
+            self._invalidate()
         except Exception as e:
             logger.error(f"Error setting configuration value for {key}: {e}")
     
-    def get_all(self) -> Dict:
+    def get_all(self) -> Union[Dict, Mapping[str, Any]]:
         """
         Get the entire configuration.
         
         Returns:
-            Configuration dictionary
+            Configuration dictionary, or its read-only view once frozen
         """
-        return self.config
+        return self.config if self._frozen is None else self._frozen
     
     def update(self, config: Dict) -> None:
         """
@@ -238,70 +543,140 @@ class Config:
             config: Dictionary with new configuration values
         """
         try:
+            self._check_mutable()
             self._update_dict(self.config, config)
+            self._invalidate()
         except Exception as e:
             logger.error(f"Error updating configuration: {e}")
     
     def _update_dict(self, target: Dict, source: Dict) -> None:
         """
-        Recursively update a dictionary with values from another dictionary.
+        Deep-update a dictionary with values from another dictionary.
+        
+        Nested levels are merged from an explicit stack rather than by recursion, so
+        deep configurations cannot hit the recursion limit.
         
         Args:
             target: Target dictionary to update
             source: Source dictionary with new values
         """
-        for key, value in source.items():
-            if isinstance(value, dict) and key in target and isinstance(target[key], dict):
-                # Recursively update nested dictionaries
-                self._update_dict(target[key], value)
-            else:
-                # Update or add the value
-                target[key] = value
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            nested = [
+                key for key, value in source.items()
+                if isinstance(value, dict) and isinstance(target.get(key), dict)
+            ]
+            if not nested:
+                # No dictionaries to merge, so a single dict.update does the whole job
+                target.update(source)
+                continue
+            
+            # Merge nested dictionaries later, then add or replace the rest
+            stack.extend((target[key], source[key]) for key in nested)
+            nested = set(nested)
+            target.update({key: value for key, value in source.items() if key not in nested})
     
     def _load_env_vars(self) -> None:
         """Load configuration from environment variables."""
         try:
-            # Load TRADINGAPP_ prefixed vars into nested config
+            # Load TRADINGAPP_ prefixed vars into nested config; filter the environment in one pass
             prefix = 'TRADINGAPP_'
-            for key, value in os.environ.items():
-                if key.startswith(prefix):
-                    config_key = key[len(prefix):].lower()
-                    if '_' in config_key:
-                        parts = config_key.split('_')
-                        config = self.config
-                        for part in parts[:-1]:
-                            if part not in config or not isinstance(config[part], dict):
-                                config[part] = {}
-                            config = config[part]
-                        config[parts[-1]] = self._parse_env_value(value)
-                    else:
-                        self.config[config_key] = self._parse_env_value(value)
+            prefix_len = len(prefix)
+            overrides = [
+                (key[prefix_len:].lower().split('_'), value)
+                for key, value in _ENV_SNAPSHOT.items()
+                if key.startswith(prefix) and key != _JSON_SIDECAR_ENV
+            ]
+            for parts, value in overrides:
+                self._parent_dict(self.config, parts)[parts[-1]] = self._parse_env_value(value)
+            if overrides:
+                self._invalidate()
 
             # Explicitly load .env file if present at project root to populate environment
             # This is a light inline loader to avoid extra dependencies.
-            env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
-            env_path = os.path.abspath(env_path)
-            if os.path.exists(env_path):
-                try:
-                    with open(env_path, "r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line or line.startswith("#"):
-                                continue
-                            if "=" not in line:
-                                continue
-                            k, v = line.split("=", 1)
-                            k = k.strip()
-                            v = v.strip().strip('"').strip("'")
-                            # Do not overwrite existing environment variables
-                            if k and k not in os.environ:
-                                os.environ[k] = v
-                except Exception as env_e:
-                    logger.warning(f"Could not parse .env file at {env_path}: {env_e}")
+            self._load_env_file(_ENV_FILE)
 
         except Exception as e:
             logger.error(f"Error loading environment variables: {e}")
     
+    @staticmethod
+    def _load_env_file(env_path: str) -> None:
+        """
+        Load variables from a .env file into the environment.
+        
+        The file is only parsed again if it changed since it was last loaded by this
+        process, so constructing more Config objects does not re-read it.
+        
+        Args:
+            env_path: Path to the .env file
+        """
+        try:
+            mtime = os.stat(env_path).st_mtime_ns
+        except OSError:
+            return
+        
+        with _ENV_FILE_LOCK:
+            if _ENV_FILES_LOADED.get(env_path) == mtime:
+                return
+            
+            try:
+                with open(env_path, "r", encoding="utf-8") as f:
+                    entries = _ENV_LINE_RE.findall(f.read())
+                
+                for k, v in entries:
+                    # Do not overwrite existing environment variables
+                    if k not in os.environ:
+                        os.environ[k] = _ENV_SNAPSHOT[k] = v.strip().strip('"').strip("'")
+                _ENV_FILES_LOADED[env_path] = mtime
+            except Exception as env_e:
+                logger.warning(f"Could not parse .env file at {env_path}: {env_e}")
+    
+    @staticmethod
+    def _parent_dict(config: Dict, parts: Sequence[str]) -> Dict:
+        """
+        Get the dictionary that holds the last key of a path, creating it if needed.
+        
+        Missing intermediate keys, and intermediate keys holding non-dict values, are
+        replaced by empty dictionaries.
+        
+        Args:
+            config: Root configuration dictionary
+            parts: Key path
+            
+        Returns:
+            Dictionary in which parts[-1] should be stored
+        """
+        for part in parts[:-1]:
+            child = config.setdefault(part, {})
+            if not isinstance(child, dict):
+                child = config[part] = {}
+            config = child
+        return config
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget previously parsed configuration files.
+        
+        Parsed files are reused within the process while their modification time and
+        size are unchanged. Call this to force the next load_config() to parse the file
+        again, e.g. when it may have been rewritten within the same timestamp.
+        """
+        filecache.clear()
+    
+    @staticmethod
+    def refresh_env() -> None:
+        """
+        Re-read the process environment.
+        
+        Environment variables are read once at import rather than on every lookup.
+        Call this after changing os.environ for the change to affect Config objects
+        created afterwards.
+        """
+        _ENV_SNAPSHOT.clear()
+        _ENV_SNAPSHOT.update(os.environ)
+    
     @staticmethod
     def _parse_env_value(value: str) -> Any:
         """
@@ -314,22 +689,17 @@ class Config:
             Parsed value (bool, int, float, or string)
         """
         # Convert to boolean if it's a boolean string
-        if value.lower() in ['true', 'yes', '1']:
+        lowered = value.lower()
+        if lowered in _ENV_TRUE:
             return True
-        elif value.lower() in ['false', 'no', '0']:
+        elif lowered in _ENV_FALSE:
             return False
-            
-        # Convert to integer if it's an integer string
-        try:
+        
+        # Classify numbers by pattern rather than by catching conversion errors
+        if _ENV_INT_RE.fullmatch(value):
             return int(value)
-        except ValueError:
-            pass
-            
-        # Convert to float if it's a float string
-        try:
+        elif _ENV_FLOAT_RE.fullmatch(value):
             return float(value)
-        except ValueError:
-            pass
             
         # Return as string
         return value
@@ -345,41 +715,10 @@ class Config:
             True if successful, False otherwise
         """
         try:
-            # Create default configuration
-            default_config = {
-                'sources': {
-                    'yahoo_finance': {
-                        'enabled': True,
-                        'symbols': ['AAPL', 'MSFT', 'GOOGL', 'AMZN'],
-                        'data_points': ['price', 'volume', 'market_cap', 'pe_ratio']
-                    },
-                    'cnbc': {
-                        'enabled': True,
-                        'categories': ['markets', 'business', 'investing'],
-                        'max_articles': 50
-                    },
-                    'cointelegraph': {
-                        'enabled': True,
-                        'cryptocurrencies': ['BTC', 'ETH', 'XRP', 'ADA'],
-                        'include_news': True
-                    }
-                },
-                'storage': {
-                    'type': 'csv',  # 'csv', 'sqlite', or 'json'
-                    'path': './data'
-                },
-                'scheduling': {
-                    'frequency': 'once',  # 'once', 'hourly', 'daily'
-                    'time': '09:00'  # For 'daily' frequency
-                },
-                'logging': {
-                    'level': 'INFO',  # 'DEBUG', 'INFO', 'WARNING', 'ERROR'
-                    'file': './logs/app.log'
-                }
-            }
-            
-            # Update the configuration
-            self.config = default_config
+            self._check_mutable()
+            # Start from a private copy of the default template
+            self.config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+            self._invalidate()
             
             # Save the configuration
             return self.save_config(config_path)
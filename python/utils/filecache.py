@@ -0,0 +1,75 @@
+"""
+File cache module for the Trading Information Scraper application.
+
+This module provides a cache for data parsed from files, so that a file which has
+not changed since it was last parsed does not have to be parsed again.
+"""
+
+import logging
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# In-process entries: absolute path -> (file stamp, pickled data). The data is only
+# pickled here to hand out cheap independent copies; nothing is read back from disk.
+_MEMO: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def get(path: str) -> Optional[Any]:
+    """
+    Get the cached parsed contents of a file.
+
+    An entry is only returned while the file's modification time and size match
+    the ones it was stored with. Each call returns a fresh copy, so callers may
+    modify the result freely.
+
+    Args:
+        path: Path to the source file
+
+    Returns:
+        Cached data, or None if there is no valid entry
+    """
+    try:
+        path = os.path.abspath(path)
+        entry = _MEMO.get(path)
+        if entry is None:
+            return None
+
+        cached_stamp, blob = entry
+        if cached_stamp != _stamp(path):
+            return None
+
+        return pickle.loads(blob)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unusable file cache entry for {path}: {e}")
+        return None
+
+
+def put(path: str, data: Any) -> None:
+    """
+    Store the parsed contents of a file.
+
+    Args:
+        path: Path to the source file
+        data: Parsed contents of the file
+    """
+    try:
+        path = os.path.abspath(path)
+        _MEMO[path] = (_stamp(path), pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        logger.debug(f"Could not cache parsed contents of {path}: {e}")
+
+
+def clear() -> None:
+    """Drop all cache entries."""
+    _MEMO.clear()
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    """Get the (modification time, size) pair identifying a version of a file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
@@ -5,17 +5,241 @@ This module provides functionality for visualizing financial data.
 """
 
 import logging
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
 import pandas as pd
 import seaborn as sns
 
+try:
+    # Optional JIT compiler for the LTTB selection loop
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Data artists with more points than this are rasterized in vector output by default
+_RASTERIZE_MIN_POINTS = 10_000
+
+# Chart style: seaborn's whitegrid look plus font sizes, applied only while a chart is built
+_MPL_STYLE = {
+    **sns.axes_style("whitegrid"),
+    'figure.figsize': (10, 6),
+    'font.size': 12,
+    'axes.titlesize': 14,
+    'axes.labelsize': 12,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 16
+}
+
+# Directories charts have already been saved to or created in, so they are not checked again
+_ENSURED_DIRS = set()
+
+# Grid points of the binned kernel density estimate in plot_distribution
+_KDE_GRID_SIZE = 256
+
+# Heatmaps with this many cells or more are drawn without value annotations
+_HEATMAP_ANNOT_MAX_CELLS = 400
+
+# Most row/column labels drawn along each heatmap axis
+_HEATMAP_MAX_TICKS = 50
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick the points of a line to keep with Largest-Triangle-Three-Buckets downsampling.
+    
+    The first and last points are always kept. The points in between are split into
+    n_out - 2 buckets, and from each bucket the point forming the largest triangle with
+    the previously kept point and the average of the next bucket is kept, which
+    preserves the visual shape (peaks and troughs) of the line.
+    
+    Args:
+        x: X values as floats, in plotting order
+        y: Y values as floats
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted indices of the points to keep
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # Bucket i covers [bounds[i], bounds[i + 1]); the last "bucket" is the final point
+    bounds = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    bounds = np.append(bounds, n)
+    
+    # Average of every bucket from precomputed cumulative sums
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = np.diff(bounds)
+    avg_x = (cum_x[bounds[1:]] - cum_x[bounds[:-1]]) / counts
+    avg_y = (cum_y[bounds[1:]] - cum_y[bounds[:-1]]) / counts
+    
+    return _lttb_select(x, y, bounds, avg_x, avg_y)
+
+
+def _lttb_select_numpy(
+    x: np.ndarray, y: np.ndarray, bounds: np.ndarray, avg_x: np.ndarray, avg_y: np.ndarray
+) -> np.ndarray:
+    """
+    Pick the largest-triangle point of every bucket, vectorized within each bucket.
+    
+    Args:
+        x: X values as floats
+        y: Y values as floats
+        bounds: Bucket start offsets, followed by the end of the data
+        avg_x: Average x value of every bucket
+        avg_y: Average y value of every bucket
+        
+    Returns:
+        Sorted indices of the points to keep
+    """
+    n_out = len(bounds)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = len(x) - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x[i + 1]) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y[i + 1] - ay))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[i + 1] = a
+    
+    return indices
+
+
+def _lttb_select_scalar(
+    x: np.ndarray, y: np.ndarray, bounds: np.ndarray, avg_x: np.ndarray, avg_y: np.ndarray
+) -> np.ndarray:
+    """
+    Same as _lttb_select_numpy, written as plain loops for numba to compile.
+    
+    NaN areas compare false and are never picked, matching the NumPy version.
+    """
+    n_out = len(bounds)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = len(x) - 1
+    a = 0
+    for i in range(n_out - 2):
+        ax = x[a]
+        ay = y[a]
+        bx = avg_x[i + 1]
+        by = avg_y[i + 1]
+        best = -1.0
+        best_j = bounds[i]
+        for j in range(bounds[i], bounds[i + 1]):
+            area = abs((ax - bx) * (y[j] - ay) - (ax - x[j]) * (by - ay))
+            if area > best:
+                best = area
+                best_j = j
+        a = best_j
+        indices[i + 1] = a
+    
+    return indices
+
+
+# Compiled loops avoid the per-bucket NumPy call overhead; fall back to NumPy without numba
+_lttb_select = njit(_lttb_select_scalar) if njit is not None else _lttb_select_numpy
+
+
+def _styled(method: Callable) -> Callable:
+    """
+    Build a chart under the module's style without changing the global rcParams.
+    
+    Args:
+        method: Plot method to wrap
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with plt.style.context(_MPL_STYLE):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def _binned_kde(values: np.ndarray, grid_size: int = _KDE_GRID_SIZE) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+    """
+    Estimate a Gaussian kernel density on a regular grid.
+    
+    The values are binned onto the grid and the bin counts are convolved with the
+    Gaussian kernel by FFT, which costs O(N + G log G) for N values and G grid points
+    rather than evaluating every value at every grid point. Like seaborn, the bandwidth
+    follows Scott's rule and the grid extends three bandwidths past the data.
+    
+    Args:
+        values: Sample values; non-finite values are ignored
+        grid_size: Number of grid points
+        
+    Returns:
+        Tuple of the grid, the density at each grid point and the number of values
+        used, or None if there are too few distinct values to estimate a density
+    """
+    values = values[np.isfinite(values)]
+    n = len(values)
+    if n < 2:
+        return None
+    bandwidth = values.std(ddof=1) * n ** (-1 / 5)
+    if not bandwidth > 0:
+        return None
+    
+    counts, edges = np.histogram(
+        values, bins=grid_size, range=(values.min() - 3 * bandwidth, values.max() + 3 * bandwidth)
+    )
+    step = edges[1] - edges[0]
+    
+    sigma = bandwidth / step
+    half = int(np.ceil(4 * sigma))
+    offsets = np.arange(-half, half + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel /= kernel.sum()
+    
+    size = grid_size + len(kernel) - 1
+    smoothed = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)[half:half + grid_size]
+    
+    grid = (edges[:-1] + edges[1:]) / 2
+    return grid, np.clip(smoothed, 0, None) / (n * step), n
+
+
+def _axis_values(series: pd.Series) -> np.ndarray:
+    """
+    Get plot-axis positions as floats for downsampling.
+    
+    Numbers are used as-is and datetimes as their integer timestamps; anything else
+    (e.g. category labels) is placed at its row position.
+    
+    Args:
+        series: Column to convert
+        
+    Returns:
+        Float array with one value per row
+    """
+    try:
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.astype('int64').to_numpy(dtype=float)
+        if pd.api.types.is_numeric_dtype(series):
+            return series.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        pass
+    return np.arange(len(series), dtype=float)
+
 
 class DataVisualizer:
     """
@@ -24,19 +248,21 @@ class DataVisualizer:
     This class provides methods for creating visualizations of financial data.
     """
     
-    def __init__(self, output_dir: str = "./visualizations"):
+    def __init__(self, output_dir: str = "./visualizations", interactive: bool = False):
         """
         Initialize the data visualizer.
         
         Args:
             output_dir: Directory to store visualizations
+            interactive: Create figures through pyplot, so they can be shown with plt.show()
+                (and must be closed with plt.close()); by default figures are rendered
+                with Agg without touching pyplot or its backend
         """
         self.output_dir = output_dir
+        self.interactive = interactive
         self._ensure_directory_exists()
-        
-        # Set up the visualization style
-        self._setup_style()
     
+    @_styled
     def plot_time_series(
         self,
         data: pd.DataFrame,
@@ -48,6 +274,8 @@ class DataVisualizer:
         figsize: Tuple[int, int] = (10, 6),
         color: str = '#1f77b4',
         grid: bool = True,
+        max_points: Optional[int] = 5000,
+        rasterize: Optional[bool] = None,
         save_path: Optional[str] = None
     ) -> plt.Figure:
         """
@@ -63,17 +291,26 @@ class DataVisualizer:
             figsize: Figure size as (width, height) in inches
             color: Line color
             grid: Whether to show grid lines
+            max_points: Downsample longer series to this many points with LTTB,
+                keeping their visual shape (None to plot every point)
+            rasterize: Embed the data as an image in vector output (PDF/SVG) while
+                keeping axes and text as vectors (default: when over 10,000 points)
             save_path: Path to save the figure (if None, the figure is not saved)
             
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot the data
-            ax.plot(data[x], data[y], color=color, linewidth=2)
+            points = self._downsample_line(data, x, y, max_points)
+            ax.plot(
+                *self._as_arrays(points, x, y), color=color, linewidth=2,
+                rasterized=self._should_rasterize(points, rasterize)
+            )
             
             # Set title and labels
             if title:
@@ -88,9 +325,6 @@ class DataVisualizer:
             if pd.api.types.is_datetime64_any_dtype(data[x]):
                 fig.autofmt_xdate()
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -99,8 +333,53 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting time series: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
+    
+    @_styled
+    def update_time_series(
+        self,
+        fig: plt.Figure,
+        data: pd.DataFrame,
+        x: str,
+        y: str,
+        max_points: Optional[int] = 5000,
+        save_path: Optional[str] = None
+    ) -> plt.Figure:
+        """
+        Replace the data of a chart made by plot_time_series() in place.
+        
+        Only the line's vertices and the axis limits change, so refreshing a chart with
+        new data skips rebuilding the figure, axes, labels and styling.
+        
+        Args:
+            fig: Figure returned by plot_time_series()
+            data: DataFrame containing the new data
+            x: Column name for the x-axis
+            y: Column name for the y-axis
+            max_points: Downsample a longer series to this many points with LTTB, as
+                plot_time_series() does (None to plot every point)
+            save_path: Path to save the figure (if None, the figure is not saved)
+            
+        Returns:
+            The updated figure
+        """
+        try:
+            ax = fig.axes[0]
+            points = self._downsample_line(data, x, y, max_points)
+            ax.lines[0].set_data(*self._as_arrays(points, x, y))
+            ax.relim()
+            ax.autoscale_view()
+            
+            # Save the figure if a path is provided
+            if save_path:
+                self._save_figure(fig, save_path)
+            
+            return fig
+        except Exception as e:
+            logger.error(f"Error updating time series: {e}")
+            return fig
     
+    @_styled
     def plot_comparison(
         self,
         data: pd.DataFrame,
@@ -112,6 +391,8 @@ class DataVisualizer:
         figsize: Tuple[int, int] = (12, 6),
         colors: Optional[List[str]] = None,
         grid: bool = True,
+        max_points: Optional[int] = 5000,
+        rasterize: Optional[bool] = None,
         save_path: Optional[str] = None
     ) -> plt.Figure:
         """
@@ -127,19 +408,41 @@ class DataVisualizer:
             figsize: Figure size as (width, height) in inches
             colors: List of colors for each series
             grid: Whether to show grid lines
+            max_points: Downsample longer series to this many points with LTTB,
+                keeping their visual shape (None to plot every point)
+            rasterize: Embed the data as an image in vector output (PDF/SVG) while
+                keeping axes and text as vectors (default: when over 10,000 points)
             save_path: Path to save the figure (if None, the figure is not saved)
             
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot each series
-            for i, y in enumerate(y_list):
-                color = colors[i] if colors and i < len(colors) else None
-                ax.plot(data[x], data[y], label=y, linewidth=2, color=color)
+            if max_points and len(data) > max_points:
+                # LTTB keeps different rows for each series, so they are plotted one by one
+                lines = []
+                for y in y_list:
+                    points = self._downsample_line(data, x, y, max_points)
+                    lines += ax.plot(
+                        *self._as_arrays(points, x, y), linewidth=2,
+                        rasterized=self._should_rasterize(points, rasterize)
+                    )
+            else:
+                # Series sharing the x values are plotted in a single call from a 2D array
+                lines = ax.plot(
+                    self._as_arrays(data, x)[0], data[y_list].to_numpy(), linewidth=2,
+                    rasterized=self._should_rasterize(data, rasterize)
+                )
+
+            for i, (line, y) in enumerate(zip(lines, y_list)):
+                line.set_label(y)
+                if colors and i < len(colors):
+                    line.set_color(colors[i])
             
             # Set title and labels
             if title:
@@ -157,9 +460,6 @@ class DataVisualizer:
             if pd.api.types.is_datetime64_any_dtype(data[x]):
                 fig.autofmt_xdate()
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -168,8 +468,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting comparison: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_distribution(
         self,
         data: pd.DataFrame,
@@ -180,6 +481,7 @@ class DataVisualizer:
         figsize: Tuple[int, int] = (10, 6),
         color: str = '#1f77b4',
         kde: bool = True,
+        fast_kde: bool = True,
         save_path: Optional[str] = None
     ) -> plt.Figure:
         """
@@ -194,17 +496,28 @@ class DataVisualizer:
             figsize: Figure size as (width, height) in inches
             color: Histogram color
             kde: Whether to show the kernel density estimate
+            fast_kde: Estimate the density on a fixed grid of binned values with an FFT
+                convolution, whose cost barely grows with the number of values, instead
+                of seaborn's exact estimate
             save_path: Path to save the figure (if None, the figure is not saved)
             
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot the distribution
-            sns.histplot(data[column], kde=kde, color=color, ax=ax)
+            values = data[column]
+            sns.histplot(values, kde=kde and not fast_kde, color=color, ax=ax)
+            if kde and fast_kde:
+                curve = _binned_kde(pd.to_numeric(values, errors='coerce').to_numpy(dtype=float))
+                if curve is not None and ax.patches:
+                    # Scale the density to the histogram's counts per bin
+                    grid, density, n = curve
+                    ax.plot(grid, density * n * ax.patches[0].get_width(), color=color)
             
             # Set title and labels
             if title:
@@ -212,9 +525,6 @@ class DataVisualizer:
             ax.set_xlabel(xlabel or column, fontsize=12)
             ax.set_ylabel(ylabel, fontsize=12)
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -223,8 +533,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting distribution: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_bar(
         self,
         data: pd.DataFrame,
@@ -256,28 +567,31 @@ class DataVisualizer:
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
-            # Coerce y column to numeric and drop NaNs to avoid type errors during plotting
-            safe = data.copy()
-            if y in safe.columns:
-                safe[y] = pd.to_numeric(safe[y], errors='coerce')
-                before = len(safe)
-                safe = safe.dropna(subset=[y])
-                dropped = before - len(safe)
-                if dropped > 0:
-                    logger.warning(f"plot_bar: dropped {dropped} rows with non-numeric or missing values in '{y}'")
-            else:
+            if y not in data.columns:
                 logger.error(f"plot_bar: column '{y}' not found in DataFrame")
-                return plt.figure()
+                return Figure()
+            
+            # Coerce y to numeric only when needed and mask out NaNs instead of copying the frame
+            values = data[y]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors='coerce')
+            mask = values.notna().to_numpy()
+            x_vals = data[x].to_numpy()[mask]
+            y_vals = values.to_numpy()[mask]
+            dropped = len(mask) - len(y_vals)
+            if dropped > 0:
+                logger.warning(f"plot_bar: dropped {dropped} rows with non-numeric or missing values in '{y}'")
 
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot the bar chart
             if horizontal:
-                ax.barh(safe[x], safe[y], color=color)
+                ax.barh(x_vals, y_vals, color=color)
             else:
-                ax.bar(safe[x], safe[y], color=color)
+                ax.bar(x_vals, y_vals, color=color)
             
             # Set title and labels
             if title:
@@ -286,11 +600,8 @@ class DataVisualizer:
             ax.set_ylabel(ylabel or y, fontsize=12)
             
             # Rotate x-axis labels for better readability if not horizontal
-            if not horizontal and len(safe) > 5:
-                plt.xticks(rotation=45, ha='right')
-            
-            # Tight layout
-            fig.tight_layout()
+            if not horizontal and len(y_vals) > 5:
+                plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
             # Save the figure if a path is provided
             if save_path:
@@ -300,8 +611,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting bar chart: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_scatter(
         self,
         data: pd.DataFrame,
@@ -313,6 +625,8 @@ class DataVisualizer:
         figsize: Tuple[int, int] = (10, 6),
         color: str = '#1f77b4',
         alpha: float = 0.7,
+        max_points: Optional[int] = 5000,
+        rasterize: Optional[bool] = None,
         save_path: Optional[str] = None
     ) -> plt.Figure:
         """
@@ -328,17 +642,26 @@ class DataVisualizer:
             figsize: Figure size as (width, height) in inches
             color: Point color
             alpha: Point transparency
+            max_points: Plot a random sample of this many points from larger data
+                (None to plot every point)
+            rasterize: Embed the data as an image in vector output (PDF/SVG) while
+                keeping axes and text as vectors (default: when over 10,000 points)
             save_path: Path to save the figure (if None, the figure is not saved)
             
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot the scatter chart
-            ax.scatter(data[x], data[y], color=color, alpha=alpha)
+            points = self._sample_points(data, max_points)
+            ax.scatter(
+                *self._as_arrays(points, x, y), color=color, alpha=alpha,
+                rasterized=self._should_rasterize(points, rasterize)
+            )
             
             # Set title and labels
             if title:
@@ -346,9 +669,6 @@ class DataVisualizer:
             ax.set_xlabel(xlabel or x, fontsize=12)
             ax.set_ylabel(ylabel or y, fontsize=12)
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -357,8 +677,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting scatter chart: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_pie(
         self,
         data: pd.DataFrame,
@@ -386,9 +707,10 @@ class DataVisualizer:
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
             
             # Plot the pie chart
             ax.pie(
@@ -407,9 +729,6 @@ class DataVisualizer:
             if title:
                 ax.set_title(title, fontsize=14)
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -418,8 +737,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting pie chart: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_heatmap(
         self,
         data: pd.DataFrame,
@@ -437,26 +757,44 @@ class DataVisualizer:
             title: Chart title
             figsize: Figure size as (width, height) in inches
             cmap: Colormap name
-            annot: Whether to annotate cells with values
+            annot: Whether to annotate cells with values (only done below 400 cells)
             save_path: Path to save the figure (if None, the figure is not saved)
             
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Create figure and axis
-            fig, ax = plt.subplots(figsize=figsize)
+            fig, ax = self._create_figure(figsize)
+            
+            # Plot the heatmap as a single image rather than one mesh quad per cell
+            values = data.to_numpy(dtype=float)
+            image = ax.imshow(values, cmap=cmap, aspect='auto', interpolation='nearest')
+            fig.colorbar(image, ax=ax)
+            ax.grid(False)
             
-            # Plot the heatmap
-            sns.heatmap(data, annot=annot, cmap=cmap, ax=ax)
+            # Label the rows and columns, thinning the labels of large matrices
+            rows, cols = values.shape
+            xticks = np.arange(0, cols, -(-cols // _HEATMAP_MAX_TICKS))
+            yticks = np.arange(0, rows, -(-rows // _HEATMAP_MAX_TICKS))
+            ax.set_xticks(xticks, data.columns[xticks].astype(str))
+            ax.set_yticks(yticks, data.index[yticks].astype(str))
+            
+            # Annotate the cells, in black or white depending on the cell color
+            if annot and values.size < _HEATMAP_ANNOT_MAX_CELLS:
+                luminance = image.to_rgba(values)[..., :3] @ np.array([0.2126, 0.7152, 0.0722])
+                for (i, j), value in np.ndenumerate(values):
+                    if np.isfinite(value):
+                        ax.text(
+                            j, i, f"{value:.2g}", ha='center', va='center',
+                            color='black' if luminance[i, j] > 0.408 else 'white'
+                        )
             
             # Set title
             if title:
                 ax.set_title(title, fontsize=14)
             
-            # Tight layout
-            fig.tight_layout()
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -465,8 +803,9 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting heatmap: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
     
+    @_styled
     def plot_multiple(
         self,
         data: pd.DataFrame,
@@ -497,6 +836,7 @@ class DataVisualizer:
         Returns:
             Matplotlib figure object
         """
+        fig = None
         try:
             # Determine layout if not provided
             if not layout:
@@ -506,7 +846,7 @@ class DataVisualizer:
                 layout = (rows, cols)
             
             # Create figure and axes
-            fig, axes = plt.subplots(layout[0], layout[1], figsize=figsize)
+            fig, axes = self._create_figure(figsize, layout[0], layout[1])
             
             # Flatten axes array for easier indexing
             if isinstance(axes, np.ndarray):
@@ -515,35 +855,11 @@ class DataVisualizer:
                 axes = [axes]
             
             # Create each subplot
-            for i, (spec, ax) in enumerate(zip(plot_specs, axes)):
-                plot_type = spec.get('type', 'line')
-                
-                if plot_type == 'line':
-                    x = spec.get('x')
-                    y = spec.get('y')
-                    ax.plot(data[x], data[y], color=spec.get('color', '#1f77b4'))
-                    ax.set_xlabel(spec.get('xlabel', x))
-                    ax.set_ylabel(spec.get('ylabel', y))
-                
-                elif plot_type == 'bar':
-                    x = spec.get('x')
-                    y = spec.get('y')
-                    ax.bar(data[x], data[y], color=spec.get('color', '#1f77b4'))
-                    ax.set_xlabel(spec.get('xlabel', x))
-                    ax.set_ylabel(spec.get('ylabel', y))
-                
-                elif plot_type == 'scatter':
-                    x = spec.get('x')
-                    y = spec.get('y')
-                    ax.scatter(data[x], data[y], color=spec.get('color', '#1f77b4'), alpha=spec.get('alpha', 0.7))
-                    ax.set_xlabel(spec.get('xlabel', x))
-                    ax.set_ylabel(spec.get('ylabel', y))
-                
-                elif plot_type == 'hist':
-                    column = spec.get('column')
-                    ax.hist(data[column], bins=spec.get('bins', 10), color=spec.get('color', '#1f77b4'))
-                    ax.set_xlabel(spec.get('xlabel', column))
-                    ax.set_ylabel(spec.get('ylabel', 'Frequency'))
+            for spec, ax in zip(plot_specs, axes):
+                # Unknown plot types leave the subplot empty
+                plot = self._SUBPLOTS.get(spec.get('type', 'line'))
+                if plot:
+                    plot(self, ax, data, spec)
                 
                 # Set subplot title
                 if 'title' in spec:
@@ -560,11 +876,6 @@ class DataVisualizer:
             if title:
                 fig.suptitle(title, fontsize=16)
             
-            # Tight layout
-            fig.tight_layout()
-            if title:
-                fig.subplots_adjust(top=0.9)
-            
             # Save the figure if a path is provided
             if save_path:
                 self._save_figure(fig, save_path)
@@ -573,7 +884,49 @@ class DataVisualizer:
         except Exception as e:
             logger.error(f"Error plotting multiple charts: {e}")
             # Return an empty figure in case of error
-            return plt.figure()
+            return self._error_figure(fig)
+    
+    def _sub_line(self, ax: plt.Axes, data: pd.DataFrame, spec: Dict):
+        """Draw a 'line' subplot of plot_multiple."""
+        x = spec.get('x')
+        y = spec.get('y')
+        ax.plot(*self._as_arrays(data, x, y), color=spec.get('color', '#1f77b4'))
+        ax.set_xlabel(spec.get('xlabel', x))
+        ax.set_ylabel(spec.get('ylabel', y))
+    
+    def _sub_bar(self, ax: plt.Axes, data: pd.DataFrame, spec: Dict):
+        """Draw a 'bar' subplot of plot_multiple."""
+        x = spec.get('x')
+        y = spec.get('y')
+        ax.bar(*self._as_arrays(data, x, y), color=spec.get('color', '#1f77b4'))
+        ax.set_xlabel(spec.get('xlabel', x))
+        ax.set_ylabel(spec.get('ylabel', y))
+    
+    def _sub_scatter(self, ax: plt.Axes, data: pd.DataFrame, spec: Dict):
+        """Draw a 'scatter' subplot of plot_multiple."""
+        x = spec.get('x')
+        y = spec.get('y')
+        ax.scatter(
+            *self._as_arrays(data, x, y),
+            color=spec.get('color', '#1f77b4'), alpha=spec.get('alpha', 0.7)
+        )
+        ax.set_xlabel(spec.get('xlabel', x))
+        ax.set_ylabel(spec.get('ylabel', y))
+    
+    def _sub_hist(self, ax: plt.Axes, data: pd.DataFrame, spec: Dict):
+        """Draw a 'hist' subplot of plot_multiple."""
+        column = spec.get('column')
+        ax.hist(data[column].to_numpy(), bins=spec.get('bins', 10), color=spec.get('color', '#1f77b4'))
+        ax.set_xlabel(spec.get('xlabel', column))
+        ax.set_ylabel(spec.get('ylabel', 'Frequency'))
+    
+    # Subplot drawing functions of plot_multiple by plot type
+    _SUBPLOTS: Dict[str, Callable] = {
+        'line': _sub_line,
+        'bar': _sub_bar,
+        'scatter': _sub_scatter,
+        'hist': _sub_hist,
+    }
     
     def save_plot(self, fig: plt.Figure, filename: str, format: str = 'png', dpi: int = 300) -> str:
         """
@@ -595,13 +948,50 @@ class DataVisualizer:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            fig.savefig(filepath, format=format, dpi=dpi, bbox_inches='tight')
+            self._write_figure(fig, filepath, dpi, format)
             logger.info(f"Plot saved to {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"Error saving plot to {filepath}: {e}")
             raise
     
+    def save_many(
+        self,
+        figures: List[Tuple[plt.Figure, str]],
+        format: str = 'png',
+        dpi: int = 300,
+        max_workers: int = 4
+    ) -> List[str]:
+        """
+        Save several plots to files concurrently.
+        
+        Rasterizing and PNG encoding run in C++/C code that releases the GIL, so
+        distinct figures are saved on a thread pool. Vector formats ('svg', 'pdf') share
+        backend state and are saved one after another.
+        
+        Args:
+            figures: List of (figure, filename) pairs, filenames as for save_plot()
+            format: File format ('png', 'jpg', 'svg', 'pdf')
+            dpi: Resolution in dots per inch
+            max_workers: Maximum number of figures saved at once
+            
+        Returns:
+            Paths of the files that were saved; failures are logged and skipped
+        """
+        def save(item: Tuple[plt.Figure, str]) -> Optional[str]:
+            try:
+                return self.save_plot(item[0], item[1], format=format, dpi=dpi)
+            except Exception:
+                return None
+        
+        if format.lower() in ('svg', 'pdf') or len(figures) < 2:
+            paths = [save(item) for item in figures]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(figures))) as executor:
+                paths = list(executor.map(save, figures))
+        
+        return [path for path in paths if path]
+    
     def _save_figure(self, fig: plt.Figure, save_path: str, dpi: int = 300):
         """
         Save a figure to a file.
@@ -617,37 +1007,180 @@ class DataVisualizer:
                 save_path = os.path.join(self.output_dir, save_path)
                 
             # Create the directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            save_dir = os.path.dirname(save_path)
+            if save_dir not in _ENSURED_DIRS:
+                os.makedirs(save_dir, exist_ok=True)
+                _ENSURED_DIRS.add(save_dir)
                 
             # Save the figure
-            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+            self._write_figure(fig, save_path, dpi)
             logger.info(f"Figure saved to {save_path}")
         except Exception as e:
             logger.error(f"Error saving figure to {save_path}: {e}")
     
+    @staticmethod
+    def _write_figure(fig: plt.Figure, path: str, dpi: int, format: Optional[str] = None):
+        """
+        Write a figure to a file.
+        
+        PNGs of figures with a layout engine (which already fit their contents, so no
+        tight bounding box is needed) are rasterized once and written from the RGBA
+        buffer with fast zlib compression. savefig(bbox_inches='tight') would draw the
+        figure twice and compress at the default level. Other formats and figures use
+        savefig.
+        
+        Args:
+            fig: Matplotlib figure object
+            path: Path of the file to write
+            dpi: Resolution in dots per inch
+            format: File format (default: taken from the file extension)
+        """
+        format = (format or os.path.splitext(path)[1][1:] or 'png').lower()
+        if format != 'png' or fig.get_layout_engine() is None:
+            fig.savefig(path, format=format, dpi=dpi, bbox_inches='tight')
+            return
+        
+        canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+        original_dpi = fig.dpi
+        fig.set_dpi(dpi)
+        try:
+            canvas.draw()
+            Image.fromarray(np.asarray(canvas.buffer_rgba())).save(
+                path, format='PNG', dpi=(dpi, dpi), compress_level=1
+            )
+        finally:
+            fig.set_dpi(original_dpi)
+    
+    @staticmethod
+    def _as_arrays(data: pd.DataFrame, *columns: str) -> Tuple[Any, ...]:
+        """
+        Get columns as NumPy arrays to hand to matplotlib.
+        
+        Plain arrays skip matplotlib's per-call conversion of pandas Series.
+        Timezone-aware datetimes stay Series, since as arrays they would become
+        Timestamp objects and lose the fast datetime64 path.
+        
+        Args:
+            data: DataFrame containing the data
+            *columns: Column names
+            
+        Returns:
+            One array (or Series) per column
+        """
+        return tuple(
+            data[column] if isinstance(data[column].dtype, pd.DatetimeTZDtype) else data[column].to_numpy()
+            for column in columns
+        )
+    
+    @staticmethod
+    def _should_rasterize(data: pd.DataFrame, rasterize: Optional[bool]) -> bool:
+        """
+        Decide whether to rasterize a data artist in vector output.
+        
+        Args:
+            data: Points being plotted
+            rasterize: Explicit choice, or None to decide by the number of points
+            
+        Returns:
+            True if the artist should be rasterized
+        """
+        if rasterize is not None:
+            return rasterize
+        return len(data) > _RASTERIZE_MIN_POINTS
+    
+    @staticmethod
+    def _downsample_line(data: pd.DataFrame, x: str, y: str, max_points: Optional[int]) -> pd.DataFrame:
+        """
+        Reduce the rows of a line series with LTTB when there are more than max_points.
+        
+        Args:
+            data: DataFrame containing the data
+            x: Column name for the x-axis
+            y: Column name for the y-axis
+            max_points: Maximum number of points to plot (None for no limit)
+            
+        Returns:
+            The data itself, or the rows picked by LTTB
+        """
+        if not max_points or len(data) <= max_points:
+            return data
+        
+        indices = _lttb_indices(_axis_values(data[x]), _axis_values(data[y]), max_points)
+        return data.iloc[indices]
+    
+    @staticmethod
+    def _sample_points(data: pd.DataFrame, max_points: Optional[int]) -> pd.DataFrame:
+        """
+        Take a random sample of rows for a scatter chart when there are more than max_points.
+        
+        Scatter points have no order to preserve, so a uniform sample keeps the shape of
+        the point cloud. A fixed seed keeps repeated charts of the same data identical.
+        
+        Args:
+            data: DataFrame containing the data
+            max_points: Maximum number of points to plot (None for no limit)
+            
+        Returns:
+            The data itself, or a sample of its rows in their original order
+        """
+        if not max_points or len(data) <= max_points:
+            return data
+        
+        rows = np.random.default_rng(0).choice(len(data), size=max_points, replace=False)
+        rows.sort()
+        return data.iloc[rows]
+    
+    def _create_figure(self, figsize: Tuple[int, int], nrows: int = 1, ncols: int = 1) -> Tuple[plt.Figure, Any]:
+        """
+        Create a figure and its axes.
+        
+        Unless the visualizer is interactive, figures are built directly instead of
+        with plt.subplots(), which also sets up a figure manager for the current
+        backend; they are freed as soon as the caller drops them instead of staying in
+        pyplot's registry until plt.close(). Figures use the constrained layout engine,
+        which fits labels and titles while drawing instead of in a separate
+        tight_layout() pass.
+        
+        Args:
+            figsize: Figure size as (width, height) in inches
+            nrows: Number of subplot rows
+            ncols: Number of subplot columns
+            
+        Returns:
+            Tuple of the figure and its axes (an array of axes for several subplots)
+        """
+        if self.interactive:
+            return plt.subplots(nrows, ncols, figsize=figsize, layout='constrained')
+        
+        fig = Figure(figsize=figsize, layout='constrained')
+        return fig, fig.subplots(nrows, ncols)
+    
+    def _error_figure(self, fig: Optional[plt.Figure] = None) -> plt.Figure:
+        """
+        Get the empty figure a plot method returns when it fails.
+        
+        A partly built interactive figure is closed, since pyplot would otherwise keep it
+        open; other figures are not registered anywhere and are simply dropped.
+        
+        Args:
+            fig: Figure the failed method had created, if any
+            
+        Returns:
+            Empty figure that is not registered with pyplot
+        """
+        if fig is not None and self.interactive:
+            plt.close(fig)
+        return Figure()
+    
     def _ensure_directory_exists(self):
         """Ensure the output directory exists."""
+        if self.output_dir in _ENSURED_DIRS:
+            return
+        
         try:
             os.makedirs(self.output_dir, exist_ok=True)
+            _ENSURED_DIRS.add(self.output_dir)
             logger.debug(f"Output directory {self.output_dir} ensured")
         except Exception as e:
             logger.error(f"Error ensuring output directory {self.output_dir}: {e}")
             raise
-    
-    def _setup_style(self):
-        """Set up the visualization style."""
-        try:
-            # Use seaborn style
-            sns.set_style("whitegrid")
-            
-            # Set up matplotlib parameters
-            plt.rcParams['figure.figsize'] = (10, 6)
-            plt.rcParams['font.size'] = 12
-            plt.rcParams['axes.titlesize'] = 14
-            plt.rcParams['axes.labelsize'] = 12
-            plt.rcParams['xtick.labelsize'] = 10
-            plt.rcParams['ytick.labelsize'] = 10
-            plt.rcParams['legend.fontsize'] = 10
-            plt.rcParams['figure.titlesize'] = 16
-        except Exception as e:
-            logger.error(f"Error setting up visualization style: {e}")
\ No newline at end of file